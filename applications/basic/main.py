@@ -14,12 +14,137 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 from matplotlib.patches import FancyBboxPatch
 import networkx as nx
 import numpy as np
 from typing import List, Tuple, Optional, Dict
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from contextlib import contextmanager
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # Numba is optional - the kernels then run as plain Python
+    _HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+# Steps the Hamiltonian kernel takes between cancel checks
+HAMILTON_STEP_BUDGET = 1 << 18
+
+
+# Kernels are compiled without cache=True: the on-disk cache records the importing
+# module name, which differs between running main.py as a script and importing it.
+@njit()
+def _hamiltonian_search(indptr, indices, n, cycle, path, cursor, state, dead, budget):
+    """Resumable backtracking search for a Hamiltonian path (or cycle) over CSR adjacency.
+    
+    path[0] holds the start vertex; cursor holds the next adjacency slot to try
+    at each depth and state holds [depth, visited bitmask]. dead[visited] marks
+    end vertices already known not to complete a path, so no state is explored
+    twice. Returns 1 when found (the vertex order is in path), 0 when exhausted
+    and -1 when the step budget runs out; call again to resume.
+    """
+    depth = state[0]
+    visited = state[1]
+    for _ in range(budget):
+        u = path[depth]
+        if depth == n - 1:
+            if not cycle:
+                state[0] = depth
+                state[1] = visited
+                return 1
+            for k in range(indptr[u], indptr[u + 1]):
+                if indices[k] == path[0]:
+                    state[0] = depth
+                    state[1] = visited
+                    return 1
+            # Cannot close the cycle - backtrack
+            visited ^= 1 << u
+            depth -= 1
+            continue
+            
+        if cursor[depth] == indptr[u + 1]:
+            # Every neighbour tried - remember the dead end and backtrack
+            dead[visited] |= np.uint32(1 << u)
+            if depth == 0:
+                return 0
+            visited ^= 1 << u
+            depth -= 1
+            continue
+            
+        v = indices[cursor[depth]]
+        cursor[depth] += 1
+        nv = visited | (1 << v)
+        if nv == visited or (dead[nv] >> v) & 1:
+            continue
+        depth += 1
+        path[depth] = v
+        cursor[depth] = indptr[v]
+        visited = nv
+        
+    state[0] = depth
+    state[1] = visited
+    return -1
+
+
+@njit()
+def _hierholzer(indptr, indices, edge_ids, n_edges, start):
+    """Iterative Hierholzer walk from start over CSR adjacency.
+    
+    edge_ids gives, for every adjacency slot, the id of the undirected edge
+    it belongs to. Returns the vertex sequence of the trail found; it holds
+    n_edges + 1 vertices only if every edge was reachable from start.
+    """
+    used = np.zeros(n_edges, dtype=np.bool_)
+    cursor = indptr[:-1].copy()  # next adjacency slot to try for each vertex
+    stack = np.empty(n_edges + 1, dtype=np.int32)
+    circuit = np.empty(n_edges + 1, dtype=np.int32)
+    stack[0] = start
+    top = 1
+    length = 0
+    
+    while top > 0:
+        u = stack[top - 1]
+        while cursor[u] < indptr[u + 1] and used[edge_ids[cursor[u]]]:
+            cursor[u] += 1
+            
+        if cursor[u] < indptr[u + 1]:
+            # Follow an unused edge
+            k = cursor[u]
+            used[edge_ids[k]] = True
+            cursor[u] += 1
+            stack[top] = indices[k]
+            top += 1
+        else:
+            # Dead end - emit the vertex and backtrack
+            circuit[length] = u
+            length += 1
+            top -= 1
+            
+    return circuit[:length][::-1].copy()
+
+
+def _warm_up_kernels():
+    """Compile the search and walk kernels on a tiny graph so the first real calls are fast"""
+    indptr = np.array([0, 1, 2], dtype=np.int32)
+    indices = np.array([1, 0], dtype=np.int32)
+    edge_ids = np.array([0, 0], dtype=np.int32)
+    path = np.zeros(2, dtype=np.int64)
+    cursor = np.zeros(2, dtype=np.int64)
+    state = np.zeros(2, dtype=np.int64)
+    state[1] = 1
+    _hamiltonian_search(indptr, indices, 2, False, path, cursor, state,
+                        np.zeros(4, dtype=np.uint32), HAMILTON_STEP_BUDGET)
+    _hierholzer(indptr, indices, edge_ids, 1, 0)
+
 
 class GraphTheoryVisualizer:
     def __init__(self, root):
@@ -30,13 +155,39 @@ class GraphTheoryVisualizer:
         
         # Graph data structure
         self.graph = nx.Graph()
-        self.vertices = {}  # {vertex_id: (x, y)}
+        self._x = np.empty(0, dtype=np.float64)  # vertex x positions, index == vertex_id
+        self._y = np.empty(0, dtype=np.float64)  # vertex y positions, index == vertex_id
+        self.threshold = 0.1  # hit-test radius
         self.edges = []     # [(vertex1, vertex2), ...]
+        self._edges_a = np.empty(0, dtype=np.int32)  # first endpoint of each edge
+        self._edges_b = np.empty(0, dtype=np.int32)  # second endpoint of each edge
         self.current_path = []
         self.selected_vertex = None
         self.drawing_edge = False
         self.edge_start = None
         
+        # Blitting state: cached static background and the rubber-band edge
+        self._bg = None
+        self._last_motion_ts = 0.0
+        self._labels = []  # persistent Text artist per vertex
+        
+        # Properties text is recomputed only after the graph changes
+        self._props_cache = ""
+        self._props_dirty = True
+        self._connected = False
+        self._deg_cache = None
+        
+        # Redraw batching: updates requested inside _batched() run once on exit
+        self._batch_depth = 0
+        self._batch_dirty_display = False
+        self._batch_dirty_props = False
+        
+        # Hamiltonian search runs on a worker thread; the result is polled via root.after
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._search_future = None
+        self._search_cancel = threading.Event()
+        self._search_sig = None
+        
         # Educational content based on Wilson's book
         self.learning_stages = {
             "Stage 1": {
@@ -54,6 +205,9 @@ class GraphTheoryVisualizer:
         
         self.setup_ui()
         self.create_example_graphs()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        threading.Thread(target=_warm_up_kernels, daemon=True).start()
         
     def setup_ui(self):
         """Create the main user interface with educational focus"""
@@ -109,6 +263,10 @@ class GraphTheoryVisualizer:
         ttk.Button(creation_frame, text="Clear Graph", 
                   command=self.clear_graph).pack(fill=tk.X, pady=2)
         
+        # Non-modal status line for mode hints
+        self.status_label = ttk.Label(left_panel, text="", foreground='blue')
+        self.status_label.pack(fill=tk.X, pady=(0, 10))
+        
         # Path finding controls
         path_frame = ttk.LabelFrame(left_panel, text="Path Analysis", padding=10)
         path_frame.pack(fill=tk.X, pady=(0, 10))
@@ -117,6 +275,8 @@ class GraphTheoryVisualizer:
                   command=self.find_eulerian_path).pack(fill=tk.X, pady=2)
         ttk.Button(path_frame, text="Find Hamiltonian Path", 
                   command=self.find_hamiltonian_path).pack(fill=tk.X, pady=2)
+        ttk.Button(path_frame, text="Cancel Search", 
+                  command=self.cancel_search).pack(fill=tk.X, pady=2)
         ttk.Button(path_frame, text="Clear Path", 
                   command=self.clear_path).pack(fill=tk.X, pady=2)
         
@@ -160,10 +320,27 @@ class GraphTheoryVisualizer:
         self.canvas = FigureCanvasTkAgg(self.fig, right_panel)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        # Axes are set up once; update_display only mutates the artists below
+        self.ax.set_xlim(-0.5, 2.5)
+        self.ax.set_ylim(-1.5, 1.5)
+        self.ax.set_aspect('equal')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_title("Interactive Graph Visualization", fontsize=14, fontweight='bold')
+        
+        self._edge_lc = self.ax.add_collection(
+            LineCollection([], colors='black', linewidths=2, alpha=0.7))
+        self._path_lc = self.ax.add_collection(
+            LineCollection([], colors='red', linewidths=4, alpha=0.8, zorder=2))
+        self._scatter = self.ax.scatter([], [], s=400, edgecolors='black', linewidths=2, zorder=3)
+        
+        # Rubber-band edge while drawing; animated so it stays out of the background
+        self._rubberband, = self.ax.plot([], [], 'g--', linewidth=2, alpha=0.5, animated=True)
+        
         # Bind mouse events
         self.canvas.mpl_connect('button_press_event', self.on_canvas_click)
         self.canvas.mpl_connect('motion_notify_event', self.on_canvas_motion)
         self.canvas.mpl_connect('button_release_event', self.on_canvas_release)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
         
         # Initialize display
         self.update_display()
@@ -210,6 +387,11 @@ class GraphTheoryVisualizer:
             }
         }
         
+        # Pre-bake positions and edges as arrays so loading is just slicing
+        for example in self.examples.values():
+            example["xy"] = np.asarray(example.pop("vertices"), dtype=np.float64)
+            example["edges_np"] = np.asarray(example["edges"], dtype=np.int32)
+        
     def on_stage_change(self, event=None):
         """Handle learning stage changes"""
         stage = self.stage_var.get()
@@ -220,11 +402,11 @@ class GraphTheoryVisualizer:
             
     def toggle_vertex_mode(self):
         """Toggle vertex creation mode"""
-        messagebox.showinfo("Vertex Mode", "Click anywhere on the canvas to add vertices!")
+        self.status_label.config(text="Vertex mode: click canvas to add vertices")
         
     def toggle_edge_mode(self):
         """Toggle edge creation mode"""
-        messagebox.showinfo("Edge Mode", "Click and drag between vertices to create edges!")
+        self.status_label.config(text="Edge mode: drag between vertices to add edges")
         
     def on_canvas_click(self, event):
         """Handle canvas click events"""
@@ -242,11 +424,11 @@ class GraphTheoryVisualizer:
             # Start drawing edge
             self.drawing_edge = True
             self.edge_start = vertex_id
+            self.update_display()
         else:
             # Add new vertex
-            vertex_id = len(self.vertices)
-            self.vertices[vertex_id] = (x, y)
-            self.graph.add_node(vertex_id)
+            self._add_vertex(x, y)
+            self._props_dirty = True
             self.update_display()
             self.update_properties()
             
@@ -256,8 +438,18 @@ class GraphTheoryVisualizer:
             return
             
         if self.drawing_edge and self.edge_start is not None:
-            # Update temporary edge display
-            self.update_display()
+            # Cap rubber-band updates at ~60 fps
+            now = time.monotonic()
+            if now - self._last_motion_ts < 0.016:
+                return
+            self._last_motion_ts = now
+            
+            # Only the rubber-band edge moves; blit it over the cached background
+            self._redraw_dynamic(event.xdata, event.ydata)
+            
+    def on_canvas_draw(self, event):
+        """Cache the static background after every full canvas draw"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
             
     def on_canvas_release(self, event):
         """Handle canvas mouse release"""
@@ -272,25 +464,60 @@ class GraphTheoryVisualizer:
                     # Add edge
                     self.graph.add_edge(self.edge_start, end_vertex)
                     self.edges.append((self.edge_start, end_vertex))
+                    self._edges_a = np.append(self._edges_a, np.int32(self.edge_start))
+                    self._edges_b = np.append(self._edges_b, np.int32(end_vertex))
+                    self._props_dirty = True
                     
             self.drawing_edge = False
             self.edge_start = None
+            self._rubberband.set_data([], [])
             self.update_display()
             self.update_properties()
             
-    def find_nearby_vertex(self, x, y, threshold=0.1):
-        """Find vertex near given coordinates"""
-        for vertex_id, (vx, vy) in self.vertices.items():
-            if abs(x - vx) < threshold and abs(y - vy) < threshold:
-                return vertex_id
+    def _add_vertex(self, x, y):
+        """Append a vertex at (x, y) and create its label"""
+        vertex_id = len(self._x)
+        self._x = np.append(self._x, x)
+        self._y = np.append(self._y, y)
+        self.graph.add_node(vertex_id)
+        self._add_label(vertex_id, x, y)
+        return vertex_id
+        
+    def _add_label(self, vertex_id, x, y):
+        """Create the persistent text label for a vertex"""
+        self._labels.append(self.ax.text(x, y, str(vertex_id), ha='center', va='center',
+                                         fontweight='bold', fontsize=12, zorder=4))
+        
+    def _clear_labels(self):
+        """Remove all vertex labels from the axes"""
+        for label in self._labels:
+            label.remove()
+        self._labels.clear()
+        
+    def find_nearby_vertex(self, x, y):
+        """Find the vertex nearest to the given coordinates, if within threshold"""
+        if not len(self._x):
+            return None
+            
+        dx = self._x - x
+        dy = self._y - y
+        dist_sq = dx * dx + dy * dy
+        nearest = int(dist_sq.argmin())
+        if dist_sq[nearest] < self.threshold * self.threshold:
+            return nearest
         return None
         
     def clear_graph(self):
         """Clear the entire graph"""
         self.graph.clear()
-        self.vertices.clear()
+        self._x = np.empty(0, dtype=np.float64)
+        self._y = np.empty(0, dtype=np.float64)
+        self._clear_labels()
         self.edges.clear()
+        self._edges_a = np.empty(0, dtype=np.int32)
+        self._edges_b = np.empty(0, dtype=np.int32)
         self.current_path = []
+        self._props_dirty = True
         self.update_display()
         self.update_properties()
         self.update_insights("Graph cleared. Start building a new graph!")
@@ -306,34 +533,30 @@ class GraphTheoryVisualizer:
             messagebox.showwarning("No Graph", "Please create a graph first!")
             return
             
-        # Check if graph is connected
-        if not nx.is_connected(self.graph):
+        degrees = self._degrees()
+        odd_vertices = np.flatnonzero(degrees & 1)
+        
+        if len(odd_vertices) not in (0, 2):
+            self.update_insights(f"No Eulerian path exists. Found {len(odd_vertices)} vertices with odd degree. Eulerian paths require exactly 0 or 2 odd-degree vertices.")
+            return
+            
+        indptr, indices, edge_ids = self._csr_adjacency()
+        # Start at an odd-degree vertex for a path; anywhere for a cycle
+        start = int(odd_vertices[0]) if len(odd_vertices) else 0
+        n_edges = len(edge_ids) // 2
+        path = _hierholzer(indptr, indices, edge_ids, n_edges, start)
+        
+        # The walk misses edges (or vertices stay isolated) only if the graph is disconnected
+        if len(path) != n_edges + 1 or (len(degrees) > 1 and not degrees.all()):
             self.update_insights("Graph is not connected. Eulerian paths require connected graphs.")
             return
             
-        # Count odd degree vertices
-        odd_vertices = [v for v in self.graph.nodes() if self.graph.degree(v) % 2 == 1]
-        
+        self.current_path = path.tolist()
+        self.update_display()
         if len(odd_vertices) == 0:
-            # Eulerian cycle exists
-            try:
-                path = list(nx.eulerian_circuit(self.graph))
-                self.current_path = [edge[0] for edge in path] + [path[-1][1]]
-                self.update_display()
-                self.update_insights("Eulerian cycle found! Every vertex has even degree, so you can traverse every edge exactly once and return to start.")
-            except nx.NetworkXError:
-                self.update_insights("No Eulerian cycle found. The graph must be connected with all vertices having even degree.")
-        elif len(odd_vertices) == 2:
-            # Eulerian path exists
-            try:
-                path = list(nx.eulerian_path(self.graph))
-                self.current_path = [edge[0] for edge in path] + [path[-1][1]]
-                self.update_display()
-                self.update_insights("Eulerian path found! Exactly two vertices have odd degree, so you can traverse every edge exactly once.")
-            except nx.NetworkXError:
-                self.update_insights("No Eulerian path found. The graph must be connected with exactly two vertices having odd degree.")
+            self.update_insights("Eulerian cycle found! Every vertex has even degree, so you can traverse every edge exactly once and return to start.")
         else:
-            self.update_insights(f"No Eulerian path exists. Found {len(odd_vertices)} vertices with odd degree. Eulerian paths require exactly 0 or 2 odd-degree vertices.")
+            self.update_insights("Eulerian path found! Exactly two vertices have odd degree, so you can traverse every edge exactly once.")
             
     def find_hamiltonian_path(self):
         """Find Hamiltonian path if it exists"""
@@ -341,36 +564,162 @@ class GraphTheoryVisualizer:
             messagebox.showwarning("No Graph", "Please create a graph first!")
             return
             
-        # For small graphs, try to find Hamiltonian path
-        if len(self.graph.nodes()) <= 8:
-            try:
-                # Try to find Hamiltonian cycle first
-                path = list(nx.find_cycle(self.graph, len(self.graph.nodes())))
-                if len(path) == len(self.graph.nodes()):
-                    self.current_path = [edge[0] for edge in path] + [path[-1][1]]
-                    self.update_display()
-                    self.update_insights("Hamiltonian cycle found! You can visit every vertex exactly once and return to start.")
-                    return
-            except nx.NetworkXNoCycle:
-                pass
+        n = len(self.graph.nodes())
+        if n > 15:
+            self.update_insights("Graph too large for exhaustive search. Hamiltonian path detection is NP-complete.")
+            return
+            
+        if self._search_future is not None:
+            return
+            
+        # The worker gets its own copy of the adjacency; the graph may be edited meanwhile
+        if _HAVE_NUMBA:
+            indptr, indices, _ = self._csr_adjacency()
+            path = np.zeros(n, dtype=np.int64)
+            cursor = np.zeros(n, dtype=np.int64)
+            state = np.zeros(2, dtype=np.int64)
+            # Dead ends of the cycle search depend on the fixed start; path dead ends don't
+            dead = {True: np.zeros(1 << n, dtype=np.uint32), False: np.zeros(1 << n, dtype=np.uint32)}
+            cancel = self._search_cancel
+            
+            def search(start, cycle):
+                path[0] = start
+                cursor[0] = indptr[start]
+                state[:] = (0, 1 << start)
+                # Run in budgeted slices so Cancel (and closing the window) stop it promptly
+                while True:
+                    status = _hamiltonian_search(indptr, indices, n, cycle, path, cursor, state,
+                                                 dead[cycle], HAMILTON_STEP_BUDGET)
+                    if status == 1:
+                        return path.tolist()
+                    if status == 0 or cancel.is_set():
+                        return None
+        else:
+            adjacency = {v: set(self.graph.neighbors(v)) for v in self.graph.nodes()}
+            
+            def search(start, cycle):
+                return self._warnsdorff_search(adjacency, start, cycle, self._search_cancel)
                 
-            # Try to find Hamiltonian path
-            for start in self.graph.nodes():
-                for end in self.graph.nodes():
-                    if start != end:
-                        try:
-                            path = nx.shortest_path(self.graph, start, end)
-                            if len(path) == len(self.graph.nodes()):
-                                self.current_path = path
-                                self.update_display()
-                                self.update_insights("Hamiltonian path found! You can visit every vertex exactly once.")
-                                return
-                        except nx.NetworkXNoPath:
-                            continue
-                            
+        self._search_cancel.clear()
+        self._search_sig = self._graph_signature()
+        self._search_future = self._executor.submit(self._search_hamiltonian, search, n,
+                                                    self._search_cancel)
+        self.update_insights("Searching for a Hamiltonian path...")
+        self.root.after(50, self._poll_search)
+        
+    def _search_hamiltonian(self, search, n, cancel):
+        """Worker-thread search; returns (path, is_cycle) or None. Touches no Tk state."""
+        # Try to find Hamiltonian cycle first - any start vertex will do
+        path = search(0, True) if n >= 3 else None
+        if path:
+            return path + [path[0]], True
+            
+        # Try to find Hamiltonian path
+        for start in range(n):
+            if cancel.is_set():
+                return None
+            path = search(start, False)
+            if path:
+                return path, False
+        return None
+        
+    def _poll_search(self):
+        """Apply the worker's result on the Tk thread once it is ready"""
+        future = self._search_future
+        if future is None:
+            return
+        if not future.done():
+            self.root.after(50, self._poll_search)
+            return
+            
+        self._search_future = None
+        if self._search_cancel.is_set():
+            self.update_insights("Hamiltonian search cancelled.")
+            return
+        if self._graph_signature() != self._search_sig:
+            self.update_insights("The graph changed during the search; run it again.")
+            return
+            
+        try:
+            result = future.result()
+        except Exception as exc:
+            self.update_insights(f"Hamiltonian search failed: {exc}")
+            return
+            
+        if result is None:
             self.update_insights("No Hamiltonian path found. This is a complex problem - no efficient algorithm exists for all graphs.")
+            return
+            
+        self.current_path, is_cycle = result
+        self.update_display()
+        if is_cycle:
+            self.update_insights("Hamiltonian cycle found! You can visit every vertex exactly once and return to start.")
         else:
-            self.update_insights("Graph too large for exhaustive search. Hamiltonian path detection is NP-complete.")
+            self.update_insights("Hamiltonian path found! You can visit every vertex exactly once.")
+            
+    def cancel_search(self):
+        """Stop a running Hamiltonian search"""
+        self._search_cancel.set()
+        
+    def _graph_signature(self):
+        """Cheap identity of the graph structure, compared before applying a search result"""
+        return self.graph.number_of_nodes(), tuple(self.edges)
+        
+    def on_close(self):
+        """Cancel any running search and release the worker before closing"""
+        self._search_cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+        
+    @staticmethod
+    def _warnsdorff_search(adjacency, start, cycle, cancel):
+        """Pure-Python backtracking search used when Numba is not installed.
+        
+        Neighbours are tried fewest-onward-moves first (Warnsdorff's rule);
+        the cancel event is checked at every step so the search can be stopped.
+        """
+        n = len(adjacency)
+        path = [start]
+        visited = {start}
+        
+        def extend(u):
+            if len(path) == n:
+                return not cycle or start in adjacency[u]
+            if cancel.is_set():
+                return False
+                
+            candidates = sorted(adjacency[u] - visited,
+                                key=lambda v: len(adjacency[v] - visited))
+            for v in candidates:
+                visited.add(v)
+                path.append(v)
+                if extend(v):
+                    return True
+                visited.remove(v)
+                path.pop()
+            return False
+            
+        return path if extend(start) else None
+        
+    def _degrees(self):
+        """Return vertex degrees as an int32 array, cached until the graph changes"""
+        if self._deg_cache is None or self._props_dirty:
+            self._deg_cache = np.fromiter((d for _, d in self.graph.degree()), dtype=np.int32,
+                                          count=self.graph.number_of_nodes())
+        return self._deg_cache
+        
+    def _csr_adjacency(self):
+        """Return the graph as CSR (indptr, indices, edge_ids) int32 arrays"""
+        n = len(self.graph.nodes())
+        edges = np.array(list(self.graph.edges()), dtype=np.int32).reshape(-1, 2)
+        ids = np.arange(len(edges), dtype=np.int32)
+        src = np.concatenate([edges[:, 0], edges[:, 1]])
+        dst = np.concatenate([edges[:, 1], edges[:, 0]])
+        
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        order = np.argsort(src, kind='stable')
+        return indptr, dst[order], np.concatenate([ids, ids])[order]
             
     def load_example(self, example_name):
         """Load a pre-built example graph"""
@@ -379,113 +728,159 @@ class GraphTheoryVisualizer:
             
         example = self.examples[example_name]
         
-        # Clear current graph
-        self.graph.clear()
-        self.vertices.clear()
-        self.edges.clear()
-        self.current_path = []
-        
-        # Load example
-        for i, (x, y) in enumerate(example["vertices"]):
-            self.vertices[i] = (x, y)
-            self.graph.add_node(i)
-            
-        for edge in example["edges"]:
-            self.graph.add_edge(edge[0], edge[1])
-            self.edges.append(edge)
+        with self._batched():
+            # Clear current graph
+            self.graph.clear()
+            self._clear_labels()
+            self.edges.clear()
+            self.current_path = []
+            self._props_dirty = True
+        
+            # Load example
+            xy = example["xy"]
+            self._x = xy[:, 0].copy()
+            self._y = xy[:, 1].copy()
+            self._edges_a = example["edges_np"][:, 0].copy()
+            self._edges_b = example["edges_np"][:, 1].copy()
+            self.graph.add_nodes_from(range(len(xy)))
+            self.graph.add_edges_from(example["edges"])
+            self.edges = list(example["edges"])
+            for i, (x, y) in enumerate(xy):
+                self._add_label(i, x, y)
             
-        self.update_display()
-        self.update_properties()
-        self.update_insights(example["insight"])
+            self.update_display()
+            self.update_properties()
+            self.update_insights(example["insight"])
+        
+    @contextmanager
+    def _batched(self):
+        """Defer display and properties updates until the outermost block exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._batch_dirty_display:
+                    self._batch_dirty_display = False
+                    self.update_display()
+                if self._batch_dirty_props:
+                    self._batch_dirty_props = False
+                    self.update_properties()
+                    
+    @property
+    def vertices(self):
+        """Vertex positions as {vertex_id: (x, y)}, for read-only use"""
+        return dict(enumerate(zip(self._x.tolist(), self._y.tolist())))
+        
+    def _segments(self, a, b):
+        """Gather (N, 2, 2) line segments between vertex index arrays a and b"""
+        segs = np.empty((len(a), 2, 2))
+        segs[:, 0, 0] = self._x[a]
+        segs[:, 0, 1] = self._y[a]
+        segs[:, 1, 0] = self._x[b]
+        segs[:, 1, 1] = self._y[b]
+        return segs
         
     def update_display(self):
         """Update the graph visualization"""
-        self.ax.clear()
-        
-        # Set up the plot
-        self.ax.set_xlim(-0.5, 2.5)
-        self.ax.set_ylim(-1.5, 1.5)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_title("Interactive Graph Visualization", fontsize=14, fontweight='bold')
+        if self._batch_depth > 0:
+            self._batch_dirty_display = True
+            return
+            
+        # Edges
+        self._edge_lc.set_segments(self._segments(self._edges_a, self._edges_b))
+        
+        # Vertices
+        n_vertices = len(self._x)
+        in_path = np.zeros(n_vertices, dtype=bool)
+        in_path[self.current_path] = True
+        colors = np.where(in_path, 'red', 'lightblue')
+        if self.drawing_edge and not in_path[self.edge_start]:
+            colors[self.edge_start] = 'green'
+        self._scatter.set_offsets(np.column_stack([self._x, self._y]))
+        self._scatter.set_facecolor(colors)
+            
+        # Labels are unreadable (and costly) on large graphs
+        show_labels = n_vertices < 50
+        for label in self._labels:
+            label.set_visible(show_labels)
+            
+        # Current path
+        path_edges = [(v1, v2) for v1, v2 in zip(self.current_path, self.current_path[1:])
+                      if self.graph.has_edge(v1, v2)]
+        path_a, path_b = np.array(path_edges, dtype=np.int32).reshape(-1, 2).T
+        self._path_lc.set_segments(self._segments(path_a, path_b))
+            
+        self.canvas.draw_idle()
         
-        # Draw edges
-        for edge in self.edges:
-            v1, v2 = edge
-            x1, y1 = self.vertices[v1]
-            x2, y2 = self.vertices[v2]
-            self.ax.plot([x1, x2], [y1, y2], 'k-', linewidth=2, alpha=0.7)
-            
-        # Draw vertices
-        for vertex_id, (x, y) in self.vertices.items():
-            color = 'lightblue'
-            if vertex_id in self.current_path:
-                color = 'red'
-            elif self.drawing_edge and vertex_id == self.edge_start:
-                color = 'green'
-                
-            circle = plt.Circle((x, y), 0.1, color=color, ec='black', linewidth=2)
-            self.ax.add_patch(circle)
-            self.ax.text(x, y, str(vertex_id), ha='center', va='center', 
-                        fontweight='bold', fontsize=12)
-            
-        # Draw current path
-        if len(self.current_path) > 1:
-            for i in range(len(self.current_path) - 1):
-                v1, v2 = self.current_path[i], self.current_path[i + 1]
-                if self.graph.has_edge(v1, v2):
-                    x1, y1 = self.vertices[v1]
-                    x2, y2 = self.vertices[v2]
-                    self.ax.plot([x1, x2], [y1, y2], 'r-', linewidth=4, alpha=0.8)
-                    
-        # Draw temporary edge while drawing
-        if self.drawing_edge and self.edge_start is not None:
-            x1, y1 = self.vertices[self.edge_start]
-            self.ax.plot([x1, x1], [y1, y1], 'g--', linewidth=2, alpha=0.5)
+    def _redraw_dynamic(self, x, y):
+        """Redraw only the rubber-band edge on top of the cached background"""
+        if self._bg is None or x is None or y is None:
+            return
             
-        self.canvas.draw()
+        x1, y1 = self._x[self.edge_start], self._y[self.edge_start]
+        self._rubberband.set_data([x1, x], [y1, y])
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._rubberband)
+        self.canvas.blit(self.ax.bbox)
         
     def update_properties(self):
         """Update the graph properties display"""
+        if self._batch_depth > 0:
+            self._batch_dirty_props = True
+            return
+            
+        if self._props_dirty:
+            self._props_cache = self._compute_properties()
+            self._props_dirty = False
+            
         self.properties_text.delete(1.0, tk.END)
+        self.properties_text.insert(tk.END, self._props_cache)
         
+    def _compute_properties(self):
+        """Build the properties text for the current graph"""
         if len(self.graph.nodes()) == 0:
-            self.properties_text.insert(tk.END, "No graph created yet.\n")
-            return
+            return "No graph created yet.\n"
             
+        lines = []
+        
         # Basic properties
         n_vertices = len(self.graph.nodes())
         n_edges = len(self.graph.edges())
         
-        self.properties_text.insert(tk.END, f"Vertices: {n_vertices}\n")
-        self.properties_text.insert(tk.END, f"Edges: {n_edges}\n")
-        self.properties_text.insert(tk.END, f"Connected: {nx.is_connected(self.graph)}\n")
+        lines.append(f"Vertices: {n_vertices}")
+        lines.append(f"Edges: {n_edges}")
+        self._connected = nx.is_connected(self.graph)
+        lines.append(f"Connected: {self._connected}")
         
         # Degree information
-        degrees = [self.graph.degree(v) for v in self.graph.nodes()]
-        self.properties_text.insert(tk.END, f"Min degree: {min(degrees)}\n")
-        self.properties_text.insert(tk.END, f"Max degree: {max(degrees)}\n")
+        degrees = self._degrees()
+        lines.append(f"Min degree: {int(degrees.min())}")
+        lines.append(f"Max degree: {int(degrees.max())}")
         
         # Eulerian properties
-        odd_vertices = [v for v in self.graph.nodes() if self.graph.degree(v) % 2 == 1]
-        self.properties_text.insert(tk.END, f"Odd-degree vertices: {len(odd_vertices)}\n")
+        n_odd = int((degrees & 1).sum())
+        lines.append(f"Odd-degree vertices: {n_odd}")
         
-        if len(odd_vertices) == 0:
-            self.properties_text.insert(tk.END, "→ Eulerian cycle possible\n")
-        elif len(odd_vertices) == 2:
-            self.properties_text.insert(tk.END, "→ Eulerian path possible\n")
+        if n_odd == 0:
+            lines.append("→ Eulerian cycle possible")
+        elif n_odd == 2:
+            lines.append("→ Eulerian path possible")
         else:
-            self.properties_text.insert(tk.END, "→ No Eulerian path/cycle\n")
+            lines.append("→ No Eulerian path/cycle")
             
-        # Tree properties
-        if nx.is_tree(self.graph):
-            self.properties_text.insert(tk.END, "→ This is a tree\n")
+        # Tree properties - a connected graph with n-1 edges is a tree
+        if self._connected and n_edges == n_vertices - 1:
+            lines.append("→ This is a tree")
             
         # Planarity check (simplified)
         if n_vertices >= 5 and n_edges > 3 * n_vertices - 6:
-            self.properties_text.insert(tk.END, "→ Likely non-planar\n")
+            lines.append("→ Likely non-planar")
         else:
-            self.properties_text.insert(tk.END, "→ May be planar\n")
+            lines.append("→ May be planar")
+            
+        return "\n".join(lines) + "\n"
             
     def update_insights(self, message):
         """Update the educational insights display"""
@@ -9,16 +9,76 @@ a more comprehensive educational experience with detailed explanations.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import networkx as nx
-import numpy as np
 from typing import List, Tuple, Optional, Dict
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Import our Wilson algorithms module
-from graph_algorithms import WilsonGraphAlgorithms
+# Heavy modules are bound by _import_heavy_modules() on first use, so importing
+# this module (and showing the Tk root) doesn't wait on matplotlib/NetworkX
+plt = None
+FigureCanvasTkAgg = None
+LineCollection = None
+nx = None
+np = None
+cKDTree = None
+WilsonGraphAlgorithms = None
+_HAVE_NUMBA = False
+
+def _nearest(pos_x, pos_y, valid, x, y, t):
+    """Index of the valid point closest to (x, y) within distance t, or -1"""
+    best = -1
+    best_d = t * t
+    for i in range(pos_x.shape[0]):
+        if valid[i]:
+            dx = pos_x[i] - x
+            dy = pos_y[i] - y
+            d = dx * dx + dy * dy
+            if d < best_d:
+                best_d = d
+                best = i
+    return best
+
+def _warm_up_nearest():
+    """Compile the picking kernel on a tiny input so the first click is fast"""
+    pos = np.zeros((1, 2))
+    _nearest(pos[:, 0], pos[:, 1], np.ones(1, dtype=bool), 0.0, 0.0, 0.1)
+
+def _import_heavy_modules():
+    """Import matplotlib, NetworkX, NumPy and the Wilson module once"""
+    global plt, FigureCanvasTkAgg, LineCollection, nx, np, cKDTree, WilsonGraphAlgorithms
+    global _nearest, _HAVE_NUMBA
+    if WilsonGraphAlgorithms is not None:
+        return
+        
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.collections import LineCollection
+    import networkx as nx
+    import numpy as np
+    
+    # SciPy is optional; without it vertex picking uses a linear scan
+    try:
+        from scipy.spatial import cKDTree
+    except ImportError:
+        cKDTree = None
+        
+    # Numba is optional; without it picking uses the KD-tree or a NumPy scan.
+    # No on-disk cache: it records the importing module name, which differs
+    # between running this file as a script and importing it.
+    try:
+        from numba import njit
+        _nearest = njit(_nearest)
+        _HAVE_NUMBA = True
+    except ImportError:
+        pass
+        
+    # Import our Wilson algorithms module
+    from graph_algorithms import WilsonGraphAlgorithms
+
+# Properties-panel verdicts indexed by odd-degree class
+EULERIAN_VERDICTS = ("→ Eulerian cycle possible", "→ Eulerian path possible", "→ No Eulerian path/cycle")
 
 class EnhancedGraphTheoryVisualizer:
     def __init__(self, root):
@@ -27,24 +87,70 @@ class EnhancedGraphTheoryVisualizer:
         self.root.geometry("1600x1000")
         self.root.configure(bg='#f0f0f0')
         
+        # Paint a placeholder first; the heavy imports and the real UI follow
+        # once Tk has drawn the window (idle pass, then the next timer tick)
+        self._loading_label = ttk.Label(self.root, text="Loading Graph Theory Visualizer...",
+                                        font=('Arial', 14))
+        self._loading_label.pack(expand=True)
+        self.root.after_idle(self.root.after, 0, self._finish_startup)
+        
+    def _finish_startup(self):
+        """Import the heavy modules and build the full interface"""
+        _import_heavy_modules()
+        self._loading_label.destroy()
+        
         # Initialize Wilson algorithms
         self.wilson_algorithms = WilsonGraphAlgorithms()
         
         # Graph data structure
         self.graph = nx.Graph()
-        self.vertices = {}  # {vertex_id: (x, y)}
-        self.edges = []     # [(vertex1, vertex2), ...]
+        self._pos = np.empty((0, 2))                  # (N, 2) vertex positions, row = vertex id
+        self._pos_valid = np.empty(0, dtype=bool)     # rows that hold a live vertex
+        self._kdt = None                              # lazy KD-tree over valid positions
+        self._kdt_ids = None                          # KD-tree row -> vertex id
         self.current_path = []
         self.selected_vertex = None
         self.drawing_edge = False
         self.edge_start = None
         
+        # CSR adjacency (row_ptr, col_idx) for the analysis hot paths; rebuilt after edits
+        self._csr_dirty = True
+        self._row_ptr = np.zeros(1, dtype=np.int32)
+        self._col_idx = np.empty(0, dtype=np.int32)
+        self._deg_cache = np.zeros(0, dtype=np.int32)
+        self._edge_set = set()  # canonical (min, max) vertex pairs
+        
+        # Incremental union-find over vertices; edits only ever add, clear_graph resets
+        self._uf_parent = []
+        self._uf_rank = []
+        self._uf_components = 0
+        
+        # Graph signature: bumped by every mutator, used to skip unchanged refreshes
+        self._edit_counter = 0
+        self._last_props_sig = None
+        
+        # Blitting: static background cached after each full draw
+        self._bg = None
+        
+        # Redraws requested while the canvas is unmapped run when it is shown again
+        self._pending_redraw = False
+        
+        # Hamiltonian search runs on a single worker thread so Tk stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._ham_cancel = threading.Event()
+        self._ham_future = None
+        self._ham_sig = None
+        
         # Educational state
         self.current_concept = "Graph Basics"
         self.learning_stage = 1
         
         self.setup_ui()
         self.create_example_graphs()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        if _HAVE_NUMBA:
+            threading.Thread(target=_warm_up_nearest, daemon=True).start()
         
     def setup_ui(self):
         """Create the enhanced user interface with educational focus"""
@@ -129,6 +235,10 @@ class EnhancedGraphTheoryVisualizer:
                   command=self.analyze_hamiltonian).pack(fill=tk.X, pady=2)
         ttk.Button(analysis_frame, text="Find Hamiltonian Path", 
                   command=self.find_hamiltonian_path).pack(fill=tk.X, pady=2)
+        ttk.Button(analysis_frame, text="Cancel Search", 
+                  command=self.cancel_search).pack(fill=tk.X, pady=2)
+        self.search_label = ttk.Label(analysis_frame, text="", foreground='blue')
+        self.search_label.pack(fill=tk.X, pady=2)
         ttk.Button(analysis_frame, text="Analyze Connectivity", 
                   command=self.analyze_connectivity).pack(fill=tk.X, pady=2)
         ttk.Button(analysis_frame, text="Analyze Tree Properties", 
@@ -169,11 +279,32 @@ class EnhancedGraphTheoryVisualizer:
         self.fig, self.ax = plt.subplots(figsize=(12, 9))
         self.canvas = FigureCanvasTkAgg(self.fig, right_panel)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.get_tk_widget().bind('<Map>', self.on_canvas_map)
+        
+        # Axes decoration is fixed, so set it once
+        self.ax.set_xlim(-0.5, 4.5)
+        self.ax.set_ylim(-1.5, 1.5)
+        self.ax.set_aspect('equal')
+        self.ax.grid(True, alpha=0.3)
+        self.ax.set_title("Interactive Graph Visualization - Wilson's Approach", 
+                         fontsize=14, fontweight='bold')
+        
+        # Persistent artists, updated in place by update_display
+        self._edge_lc = self.ax.add_collection(
+            LineCollection([], colors='k', linewidths=2, alpha=0.7))
+        self._path_lc = self.ax.add_collection(
+            LineCollection([], colors='red', linewidths=4, alpha=0.8, zorder=2))
+        self._scatter = self.ax.scatter([], [], s=300, edgecolors='black', linewidths=2, zorder=3)
+        self._labels = []  # one Text per vertex
+        
+        # Rubber-band edge while drawing; animated so it stays out of the background
+        self._rubber, = self.ax.plot([], [], 'g--', linewidth=2, alpha=0.5, animated=True)
         
         # Bind mouse events
         self.canvas.mpl_connect('button_press_event', self.on_canvas_click)
         self.canvas.mpl_connect('motion_notify_event', self.on_canvas_motion)
         self.canvas.mpl_connect('button_release_event', self.on_canvas_release)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
         
         # Initialize display
         self.update_display()
@@ -233,6 +364,15 @@ class EnhancedGraphTheoryVisualizer:
             }
         }
         
+        # Pre-bake each example once so loading is a copy rather than a rebuild
+        for example in self.examples.values():
+            example["_V"] = np.array(example["vertices"], dtype=float)
+            example["_E"] = np.array(example["edges"], dtype=np.int32)
+            graph = nx.Graph()
+            graph.add_nodes_from(range(len(example["vertices"])))
+            graph.add_edges_from(example["edges"])
+            example["_G"] = graph
+        
     def on_stage_change(self, event=None):
         """Handle learning stage changes"""
         stage = int(self.stage_var.get())
@@ -282,11 +422,17 @@ class EnhancedGraphTheoryVisualizer:
             # Start drawing edge
             self.drawing_edge = True
             self.edge_start = vertex_id
+            self.update_display()
         else:
             # Add new vertex
-            vertex_id = len(self.vertices)
-            self.vertices[vertex_id] = (x, y)
+            vertex_id = len(self._pos)
+            self._pos = np.vstack([self._pos, (x, y)])
+            self._pos_valid = np.append(self._pos_valid, True)
+            self._kdt = None
             self.graph.add_node(vertex_id)
+            self._uf_add()
+            self._csr_dirty = True
+            self._edit_counter += 1
             self.update_display()
             self.update_properties()
             
@@ -296,9 +442,24 @@ class EnhancedGraphTheoryVisualizer:
             return
             
         if self.drawing_edge and self.edge_start is not None:
-            # Update temporary edge display
+            # Only the rubber-band edge moves; blit it over the cached background
+            if self._bg is None or event.xdata is None or event.ydata is None:
+                return
+            x1, y1 = self._pos[self.edge_start]
+            self.canvas.restore_region(self._bg)
+            self._rubber.set_data([x1, event.xdata], [y1, event.ydata])
+            self.ax.draw_artist(self._rubber)
+            self.canvas.blit(self.ax.bbox)
+            
+    def on_canvas_map(self, event):
+        """Flush a redraw that was skipped while the canvas was hidden"""
+        if self._pending_redraw:
             self.update_display()
             
+    def on_canvas_draw(self, event):
+        """Cache the static background after every full canvas draw"""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+            
     def on_canvas_release(self, event):
         """Handle canvas mouse release"""
         if event.inaxes != self.ax:
@@ -311,7 +472,9 @@ class EnhancedGraphTheoryVisualizer:
                 if end_vertex is not None and end_vertex != self.edge_start:
                     # Add edge
                     self.graph.add_edge(self.edge_start, end_vertex)
-                    self.edges.append((self.edge_start, end_vertex))
+                    self._uf_union(self.edge_start, end_vertex)
+                    self._csr_dirty = True
+                    self._edit_counter += 1
                     
             self.drawing_edge = False
             self.edge_start = None
@@ -319,18 +482,95 @@ class EnhancedGraphTheoryVisualizer:
             self.update_properties()
             
     def find_nearby_vertex(self, x, y, threshold=0.1):
-        """Find vertex near given coordinates"""
-        for vertex_id, (vx, vy) in self.vertices.items():
-            if abs(x - vx) < threshold and abs(y - vy) < threshold:
-                return vertex_id
-        return None
+        """Find the vertex nearest to the given coordinates, within threshold"""
+        ids = np.flatnonzero(self._pos_valid)
+        if len(ids) == 0:
+            return None
+            
+        if _HAVE_NUMBA:
+            best = _nearest(self._pos[:, 0], self._pos[:, 1], self._pos_valid, x, y, threshold)
+            return int(best) if best >= 0 else None
+            
+        # A KD-tree only pays off once there are a few vertices
+        if cKDTree is not None and len(ids) >= 16:
+            if self._kdt is None:
+                self._kdt = cKDTree(self._pos[ids])
+                self._kdt_ids = ids
+            d, row = self._kdt.query([x, y], distance_upper_bound=threshold)
+            return int(self._kdt_ids[row]) if d < threshold else None
+            
+        d2 = (self._pos[ids, 0] - x) ** 2 + (self._pos[ids, 1] - y) ** 2
+        best = int(np.argmin(d2))
+        return int(ids[best]) if d2[best] < threshold * threshold else None
+        
+    def _rebuild_csr(self):
+        """Rebuild the CSR adjacency arrays from the graph if it changed"""
+        if not self._csr_dirty:
+            return
+            
+        n = self.graph.number_of_nodes()
+        edges = np.array(list(self.graph.edges()), dtype=np.int32).reshape(-1, 2)
+        m = len(edges)
+        
+        # Count degrees, then scatter each endpoint into its row
+        row_ptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(edges.ravel(), minlength=n), out=row_ptr[1:])
+        src = np.concatenate([edges[:, 0], edges[:, 1]])
+        dst = np.concatenate([edges[:, 1], edges[:, 0]])
+        col_idx = np.empty(2 * m, dtype=np.int32)
+        col_idx[:] = dst[np.argsort(src, kind='stable')]
+        
+        self._row_ptr, self._col_idx = row_ptr, col_idx
+        self._deg_cache = np.diff(row_ptr)
+        self._edge_set = set(map(tuple, np.sort(edges, axis=1).tolist()))
+        self._csr_dirty = False
+        
+    def _graph_signature(self):
+        """Cheap fingerprint that changes whenever the graph is edited"""
+        return (len(self._pos), self.graph.number_of_edges(), self._edit_counter)
+        
+    def _uf_reset(self, n=0):
+        """Reset the union-find to n singleton vertices"""
+        self._uf_parent = list(range(n))
+        self._uf_rank = [0] * n
+        self._uf_components = n
+        
+    def _uf_add(self):
+        """Add a new singleton vertex to the union-find"""
+        self._uf_parent.append(len(self._uf_parent))
+        self._uf_rank.append(0)
+        self._uf_components += 1
+        
+    def _uf_find(self, v):
+        """Find the root of v with path halving"""
+        parent = self._uf_parent
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+        
+    def _uf_union(self, u, v):
+        """Merge the components of u and v by rank"""
+        ru, rv = self._uf_find(u), self._uf_find(v)
+        if ru == rv:
+            return
+        if self._uf_rank[ru] < self._uf_rank[rv]:
+            ru, rv = rv, ru
+        self._uf_parent[rv] = ru
+        if self._uf_rank[ru] == self._uf_rank[rv]:
+            self._uf_rank[ru] += 1
+        self._uf_components -= 1
         
     def clear_graph(self):
         """Clear the entire graph"""
         self.graph.clear()
-        self.vertices.clear()
-        self.edges.clear()
+        self._pos = np.empty((0, 2))
+        self._pos_valid = np.empty(0, dtype=bool)
+        self._kdt = None
         self.current_path = []
+        self._uf_reset()
+        self._csr_dirty = True
+        self._edit_counter += 1
         self.update_display()
         self.update_properties()
         self.update_insights("Graph cleared. Start building a new graph to explore graph theory concepts!")
@@ -349,19 +589,19 @@ class EnhancedGraphTheoryVisualizer:
         analysis = self.wilson_algorithms.analyze_eulerian_properties(self.graph)
         
         # Display detailed analysis
-        analysis_text = f"EULERIAN ANALYSIS\n{'='*50}\n\n"
-        analysis_text += f"Has Eulerian Path: {analysis['has_eulerian_path']}\n"
-        analysis_text += f"Has Eulerian Cycle: {analysis['has_eulerian_cycle']}\n\n"
-        analysis_text += f"Reason: {analysis['reason']}\n\n"
-        analysis_text += f"Explanation: {analysis['explanation']}\n\n"
-        analysis_text += f"Wilson's Insight: {analysis['wilson_insight']}\n\n"
+        parts = ["EULERIAN ANALYSIS", '='*50, ""]
+        parts.append(f"Has Eulerian Path: {analysis['has_eulerian_path']}")
+        parts.append(f"Has Eulerian Cycle: {analysis['has_eulerian_cycle']}\n")
+        parts.append(f"Reason: {analysis['reason']}\n")
+        parts.append(f"Explanation: {analysis['explanation']}\n")
+        parts.append(f"Wilson's Insight: {analysis['wilson_insight']}\n")
         
         if 'degrees' in analysis:
-            analysis_text += "Vertex Degrees:\n"
+            parts.append("Vertex Degrees:")
             for vertex, degree in analysis['degrees'].items():
-                analysis_text += f"  Vertex {vertex}: {degree}\n"
+                parts.append(f"  Vertex {vertex}: {degree}")
         
-        self.update_insights(analysis_text)
+        self.update_insights("\n".join(parts) + "\n")
         
     def find_eulerian_path(self):
         """Find Eulerian path using Wilson's algorithm"""
@@ -369,14 +609,14 @@ class EnhancedGraphTheoryVisualizer:
             messagebox.showwarning("No Graph", "Please create a graph first!")
             return
             
-        path = self.wilson_algorithms.find_eulerian_path(self.graph)
+        analysis = self.wilson_algorithms.analyze_eulerian_properties(self.graph, include_details=False)
+        path = self.wilson_algorithms.find_eulerian_path(self.graph, analysis)
         
         if path:
             self.current_path = path
             self.update_display()
             self.update_insights("Eulerian path found and highlighted! This path traverses every edge exactly once.")
         else:
-            analysis = self.wilson_algorithms.analyze_eulerian_properties(self.graph)
             self.update_insights(f"No Eulerian path exists.\n\nReason: {analysis['reason']}\n\nExplanation: {analysis['explanation']}")
             
     def analyze_hamiltonian(self):
@@ -388,17 +628,17 @@ class EnhancedGraphTheoryVisualizer:
         analysis = self.wilson_algorithms.analyze_hamiltonian_properties(self.graph)
         
         # Display detailed analysis
-        analysis_text = f"HAMILTONIAN ANALYSIS\n{'='*50}\n\n"
-        analysis_text += f"Wilson's Insight: {analysis['wilson_insight']}\n\n"
-        analysis_text += f"Difficulty: {analysis['difficulty']}\n\n"
+        parts = ["HAMILTONIAN ANALYSIS", '='*50, ""]
+        parts.append(f"Wilson's Insight: {analysis['wilson_insight']}\n")
+        parts.append(f"Difficulty: {analysis['difficulty']}\n")
         
         if 'dirac_condition' in analysis:
-            analysis_text += f"Dirac's Theorem: {analysis['dirac_explanation']}\n\n"
+            parts.append(f"Dirac's Theorem: {analysis['dirac_explanation']}\n")
         
         if 'ore_condition' in analysis:
-            analysis_text += f"Ore's Theorem: {analysis['ore_explanation']}\n\n"
+            parts.append(f"Ore's Theorem: {analysis['ore_explanation']}\n")
         
-        self.update_insights(analysis_text)
+        self.update_insights("\n".join(parts) + "\n")
         
     def find_hamiltonian_path(self):
         """Find Hamiltonian path using Wilson's algorithm"""
@@ -406,14 +646,61 @@ class EnhancedGraphTheoryVisualizer:
             messagebox.showwarning("No Graph", "Please create a graph first!")
             return
             
-        path = self.wilson_algorithms.find_hamiltonian_path_simple(self.graph)
-        
-        if path:
-            self.current_path = path
-            self.update_display()
-            self.update_insights("Hamiltonian path found and highlighted! This path visits every vertex exactly once.")
-        else:
-            self.update_insights("No Hamiltonian path found. This is a complex problem - no efficient algorithm exists for all graphs. Try a different graph structure!")
+        # Only one search at a time
+        if self._ham_future is not None:
+            return
+            
+        self._ham_cancel.clear()
+        self._ham_sig = self._graph_signature()
+        self.search_label.config(text="Searching for a Hamiltonian path...")
+        # The worker searches a copy; the graph may be edited meanwhile
+        self._ham_future = self._executor.submit(
+            self.wilson_algorithms.find_hamiltonian_path_simple, self.graph.copy(), self._ham_cancel)
+        self._ham_future.add_done_callback(self._post_ham_done)
+        
+    def _post_ham_done(self, future):
+        """Worker-side callback: hand the finished search back to the Tk thread"""
+        try:
+            self.root.after(0, self._on_ham_done, future)
+        except (RuntimeError, tk.TclError):
+            pass  # The window has already been closed
+        
+    def _on_ham_done(self, future):
+        """Show the Hamiltonian search result back on the Tk thread"""
+        try:
+            if self._ham_cancel.is_set():
+                self.update_insights("Hamiltonian search cancelled.")
+                return
+            if self._ham_sig != self._graph_signature():
+                # The graph was edited while searching; the result no longer applies
+                return
+                
+            try:
+                path = future.result()
+            except Exception as exc:
+                self.update_insights(f"Hamiltonian search failed: {exc}")
+                return
+                
+            if path:
+                self.current_path = path
+                self.update_display()
+                self.update_insights("Hamiltonian path found and highlighted! This path visits every vertex exactly once.")
+            else:
+                self.update_insights("No Hamiltonian path found. This is a complex problem - no efficient algorithm exists for all graphs. Try a different graph structure!")
+        finally:
+            self._ham_future = None
+            self.search_label.config(text="")
+            
+    def cancel_search(self):
+        """Ask a running Hamiltonian search to stop"""
+        if self._ham_future is not None:
+            self._ham_cancel.set()
+            
+    def on_close(self):
+        """Stop any running search and release the worker before closing"""
+        self._ham_cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
             
     def analyze_connectivity(self):
         """Analyze connectivity using Wilson's approach"""
@@ -424,23 +711,23 @@ class EnhancedGraphTheoryVisualizer:
         analysis = self.wilson_algorithms.analyze_connectivity(self.graph)
         
         # Display detailed analysis
-        analysis_text = f"CONNECTIVITY ANALYSIS\n{'='*50}\n\n"
-        analysis_text += f"Is Connected: {analysis['is_connected']}\n\n"
-        analysis_text += f"Explanation: {analysis['explanation']}\n\n"
-        analysis_text += f"Wilson's Insight: {analysis['wilson_insight']}\n\n"
+        parts = ["CONNECTIVITY ANALYSIS", '='*50, ""]
+        parts.append(f"Is Connected: {analysis['is_connected']}\n")
+        parts.append(f"Explanation: {analysis['explanation']}\n")
+        parts.append(f"Wilson's Insight: {analysis['wilson_insight']}\n")
         
         if not analysis['is_connected'] and 'components' in analysis:
-            analysis_text += f"Components: {analysis['component_count']}\n"
+            parts.append(f"Components: {analysis['component_count']}")
             for i, component in enumerate(analysis['components']):
-                analysis_text += f"  Component {i+1}: {list(component)}\n"
+                parts.append(f"  Component {i+1}: {list(component)}")
         elif analysis['is_connected'] and 'articulation_points' in analysis:
             if analysis['has_articulation_points']:
-                analysis_text += f"Articulation Points: {analysis['articulation_points']}\n"
-                analysis_text += f"Explanation: {analysis['articulation_explanation']}\n"
+                parts.append(f"Articulation Points: {analysis['articulation_points']}")
+                parts.append(f"Explanation: {analysis['articulation_explanation']}")
             else:
-                analysis_text += f"Explanation: {analysis['articulation_explanation']}\n"
+                parts.append(f"Explanation: {analysis['articulation_explanation']}")
         
-        self.update_insights(analysis_text)
+        self.update_insights("\n".join(parts) + "\n")
         
     def analyze_tree(self):
         """Analyze tree properties using Wilson's approach"""
@@ -451,22 +738,22 @@ class EnhancedGraphTheoryVisualizer:
         analysis = self.wilson_algorithms.analyze_tree_properties(self.graph)
         
         # Display detailed analysis
-        analysis_text = f"TREE ANALYSIS\n{'='*50}\n\n"
-        analysis_text += f"Is Tree: {analysis['is_tree']}\n\n"
-        analysis_text += f"Wilson's Insight: {analysis['wilson_insight']}\n\n"
+        parts = ["TREE ANALYSIS", '='*50, ""]
+        parts.append(f"Is Tree: {analysis['is_tree']}\n")
+        parts.append(f"Wilson's Insight: {analysis['wilson_insight']}\n")
         
         if analysis['is_tree']:
-            analysis_text += f"Explanation: {analysis['explanation']}\n\n"
-            analysis_text += f"Tree Property: {analysis['tree_property']}\n"
-            analysis_text += f"Explanation: {analysis['tree_property_explanation']}\n\n"
-            analysis_text += f"Leaves: {analysis['leaves']}\n"
-            analysis_text += f"Leaf Count: {analysis['leaf_count']}\n"
-            analysis_text += f"Explanation: {analysis['leaf_explanation']}\n"
+            parts.append(f"Explanation: {analysis['explanation']}\n")
+            parts.append(f"Tree Property: {analysis['tree_property']}")
+            parts.append(f"Explanation: {analysis['tree_property_explanation']}\n")
+            parts.append(f"Leaves: {analysis['leaves']}")
+            parts.append(f"Leaf Count: {analysis['leaf_count']}")
+            parts.append(f"Explanation: {analysis['leaf_explanation']}")
         else:
-            analysis_text += f"Reason: {analysis['reason']}\n"
-            analysis_text += f"Explanation: {analysis['explanation']}\n"
+            parts.append(f"Reason: {analysis['reason']}")
+            parts.append(f"Explanation: {analysis['explanation']}")
         
-        self.update_insights(analysis_text)
+        self.update_insights("\n".join(parts) + "\n")
         
     def load_example(self, example_name):
         """Load a pre-built example graph"""
@@ -475,20 +762,17 @@ class EnhancedGraphTheoryVisualizer:
             
         example = self.examples[example_name]
         
-        # Clear current graph
-        self.graph.clear()
-        self.vertices.clear()
-        self.edges.clear()
+        # Replace the current graph with copies of the pre-baked example
+        self.graph = example["_G"].copy()
+        self._pos = example["_V"].copy()
+        self._pos_valid = np.ones(len(self._pos), dtype=bool)
+        self._kdt = None
         self.current_path = []
-        
-        # Load example
-        for i, (x, y) in enumerate(example["vertices"]):
-            self.vertices[i] = (x, y)
-            self.graph.add_node(i)
-            
-        for edge in example["edges"]:
-            self.graph.add_edge(edge[0], edge[1])
-            self.edges.append(edge)
+        self._uf_reset(len(self._pos))
+        for u, v in self.graph.edges():
+            self._uf_union(u, v)
+        self._csr_dirty = True
+        self._edit_counter += 1
             
         # Update stage if example has a specific stage
         if "stage" in example:
@@ -501,54 +785,53 @@ class EnhancedGraphTheoryVisualizer:
         
     def update_display(self):
         """Update the graph visualization"""
-        self.ax.clear()
-        
-        # Set up the plot
-        self.ax.set_xlim(-0.5, 4.5)
-        self.ax.set_ylim(-1.5, 1.5)
-        self.ax.set_aspect('equal')
-        self.ax.grid(True, alpha=0.3)
-        self.ax.set_title("Interactive Graph Visualization - Wilson's Approach", 
-                         fontsize=14, fontweight='bold')
+        # Skip drawing while the canvas is unmapped (e.g. the window is iconified);
+        # winfo_viewable() cannot tell when it is merely covered. Catch up on <Map>
+        if not self.canvas.get_tk_widget().winfo_viewable():
+            self._pending_redraw = True
+            return
+        self._pending_redraw = False
         
-        # Draw edges
-        for edge in self.edges:
-            v1, v2 = edge
-            x1, y1 = self.vertices[v1]
-            x2, y2 = self.vertices[v2]
-            self.ax.plot([x1, x2], [y1, y2], 'k-', linewidth=2, alpha=0.7)
-            
-        # Draw vertices
-        for vertex_id, (x, y) in self.vertices.items():
-            color = 'lightblue'
-            if vertex_id in self.current_path:
-                color = 'red'
-            elif self.drawing_edge and vertex_id == self.edge_start:
-                color = 'green'
-                
-            circle = plt.Circle((x, y), 0.1, color=color, ec='black', linewidth=2)
-            self.ax.add_patch(circle)
-            self.ax.text(x, y, str(vertex_id), ha='center', va='center', 
-                        fontweight='bold', fontsize=12)
-            
-        # Draw current path
-        if len(self.current_path) > 1:
-            for i in range(len(self.current_path) - 1):
-                v1, v2 = self.current_path[i], self.current_path[i + 1]
-                if self.graph.has_edge(v1, v2):
-                    x1, y1 = self.vertices[v1]
-                    x2, y2 = self.vertices[v2]
-                    self.ax.plot([x1, x2], [y1, y2], 'r-', linewidth=4, alpha=0.8)
-                    
-        # Draw temporary edge while drawing
-        if self.drawing_edge and self.edge_start is not None:
-            x1, y1 = self.vertices[self.edge_start]
-            self.ax.plot([x1, x1], [y1, y1], 'g--', linewidth=2, alpha=0.5)
+        # Edges
+        edges = np.array(list(self.graph.edges()), dtype=np.int32).reshape(-1, 2)
+        self._edge_lc.set_segments(self._pos[edges])
+            
+        # Vertices: one scatter, coloured through a NumPy mask
+        ids = np.flatnonzero(self._pos_valid)
+        in_path_mask = np.zeros(len(self._pos), dtype=bool)
+        in_path_mask[self.current_path] = True
+        colors = np.where(in_path_mask, 'red', 'lightblue').astype(object)
+        if self.drawing_edge and self.edge_start is not None and not in_path_mask[self.edge_start]:
+            colors[self.edge_start] = 'green'
+        self._scatter.set_offsets(self._pos[ids])
+        self._scatter.set_facecolor(list(colors[ids]))
+        
+        # Labels: reuse the existing Text artists and only add or remove the difference
+        while len(self._labels) > len(ids):
+            self._labels.pop().remove()
+        for label, vertex_id in zip(self._labels, ids.tolist()):
+            label.set_position(self._pos[vertex_id])
+            label.set_text(str(vertex_id))
+        for vertex_id in ids[len(self._labels):].tolist():
+            x, y = self._pos[vertex_id]
+            self._labels.append(self.ax.text(x, y, str(vertex_id), ha='center', va='center', 
+                                             fontweight='bold', fontsize=12, zorder=4))
+            
+        # Current path
+        self._rebuild_csr()
+        segs = [(self._pos[a], self._pos[b]) for a, b in zip(self.current_path, self.current_path[1:])
+                if ((a, b) if a < b else (b, a)) in self._edge_set]
+        self._path_lc.set_segments(segs)
             
         self.canvas.draw()
         
     def update_properties(self):
         """Update the graph properties display"""
+        sig = self._graph_signature()
+        if sig == self._last_props_sig:
+            return
+        self._last_props_sig = sig
+        
         self.properties_text.delete(1.0, tk.END)
         
         if len(self.graph.nodes()) == 0:
@@ -559,39 +842,38 @@ class EnhancedGraphTheoryVisualizer:
         n_vertices = len(self.graph.nodes())
         n_edges = len(self.graph.edges())
         
-        self.properties_text.insert(tk.END, f"BASIC PROPERTIES\n{'='*30}\n")
-        self.properties_text.insert(tk.END, f"Vertices: {n_vertices}\n")
-        self.properties_text.insert(tk.END, f"Edges: {n_edges}\n")
-        self.properties_text.insert(tk.END, f"Connected: {nx.is_connected(self.graph)}\n\n")
+        lines = ["BASIC PROPERTIES", '='*30]
+        lines.append(f"Vertices: {n_vertices}")
+        lines.append(f"Edges: {n_edges}")
+        self._rebuild_csr()
+        lines.append(f"Connected: {self._uf_components <= 1}\n")
         
         # Degree information
-        degrees = [self.graph.degree(v) for v in self.graph.nodes()]
-        self.properties_text.insert(tk.END, f"DEGREE ANALYSIS\n{'='*30}\n")
-        self.properties_text.insert(tk.END, f"Min degree: {min(degrees)}\n")
-        self.properties_text.insert(tk.END, f"Max degree: {max(degrees)}\n")
-        self.properties_text.insert(tk.END, f"Average degree: {sum(degrees)/len(degrees):.2f}\n\n")
+        degrees = self._deg_cache
+        lines += ["DEGREE ANALYSIS", '='*30]
+        lines.append(f"Min degree: {degrees.min()}")
+        lines.append(f"Max degree: {degrees.max()}")
+        lines.append(f"Average degree: {degrees.sum()/len(degrees):.2f}\n")
         
         # Eulerian properties
-        odd_vertices = [v for v in self.graph.nodes() if self.graph.degree(v) % 2 == 1]
-        self.properties_text.insert(tk.END, f"EULERIAN ANALYSIS\n{'='*30}\n")
-        self.properties_text.insert(tk.END, f"Odd-degree vertices: {len(odd_vertices)}\n")
-        
-        if len(odd_vertices) == 0:
-            self.properties_text.insert(tk.END, "→ Eulerian cycle possible\n")
-        elif len(odd_vertices) == 2:
-            self.properties_text.insert(tk.END, "→ Eulerian path possible\n")
-        else:
-            self.properties_text.insert(tk.END, "→ No Eulerian path/cycle\n")
+        n_odd = int(np.bitwise_and(degrees, 1).sum())
+        lines += ["EULERIAN ANALYSIS", '='*30]
+        lines.append(f"Odd-degree vertices: {n_odd}")
+        
+        # 0 odd -> cycle, 2 odd -> path, anything else -> neither
+        lines.append(EULERIAN_VERDICTS[(n_odd != 0) + (n_odd not in (0, 2))])
             
-        # Tree properties
-        if nx.is_tree(self.graph):
-            self.properties_text.insert(tk.END, "→ This is a tree\n")
+        # Tree properties - a connected graph with n-1 edges is a tree
+        if n_edges == n_vertices - 1 and self._uf_components == 1:
+            lines.append("→ This is a tree")
             
         # Planarity check (simplified)
         if n_vertices >= 5 and n_edges > 3 * n_vertices - 6:
-            self.properties_text.insert(tk.END, "→ Likely non-planar\n")
+            lines.append("→ Likely non-planar")
         else:
-            self.properties_text.insert(tk.END, "→ May be planar\n")
+            lines.append("→ May be planar")
+            
+        self.properties_text.insert(tk.END, "\n".join(lines) + "\n")
             
     def update_insights(self, message):
         """Update the educational insights display"""
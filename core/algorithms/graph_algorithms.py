@@ -7,8 +7,220 @@ emphasizing visual understanding and intuitive learning.
 """
 
 import networkx as nx
-from typing import List, Tuple, Optional, Dict, Set
-import itertools
+import numpy as np
+from typing import List, Tuple, Optional, Dict, Set, Mapping
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from types import MappingProxyType
+
+# Steps the compiled Hamiltonian search takes between cancel checks
+HAMILTON_STEP_BUDGET = 1 << 18
+# Below this size the Python search finishes before the kernel would compile
+HAMILTON_COMPILED_MIN_VERTICES = 12
+# Without Numba the exhaustive search is only attempted up to this size
+HAMILTON_PYTHON_MAX_VERTICES = 12
+# Below this size NetworkX finds articulation points before the kernel would compile
+ARTICULATION_COMPILED_MIN_VERTICES = 1000
+
+def _hamilton_dfs(adj, n, cycle, path, rem, state, dead, budget):
+    """
+    Resumable iterative Hamiltonian DFS over neighbourhood bitmasks.
+    path/rem hold the partial path and each level's untried neighbours,
+    state holds [depth, visited] and dead[visited] marks dead-end end vertices.
+    Returns 1 when found, 0 when exhausted, -1 when the step budget runs out.
+    """
+    depth = state[0]
+    visited = state[1]
+    for _ in range(budget):
+        u = path[depth - 1]
+        if depth == n:
+            if not cycle or (adj[u] >> path[0]) & 1:
+                state[0] = depth
+                state[1] = visited
+                return 1
+            m = 0
+        else:
+            m = rem[depth - 1]
+        if m == 0:
+            if depth < n:
+                dead[visited] |= np.uint32(1 << u)
+            if depth == 1:
+                return 0
+            visited ^= 1 << u
+            depth -= 1
+            continue
+        v = 0
+        while not (m >> v) & 1:
+            v += 1
+        rem[depth - 1] = m & (m - 1)
+        nv = visited | (1 << v)
+        if (dead[nv] >> v) & 1:
+            continue
+        path[depth] = v
+        rem[depth] = adj[v] & ~nv
+        visited = nv
+        depth += 1
+    state[0] = depth
+    state[1] = visited
+    return -1
+
+def _articulation_points_csr(indptr, indices, n):
+    """
+    Iterative Tarjan over a CSR adjacency of vertices 0..n-1. Visits vertices and
+    neighbours in the same order as nx.articulation_points, so the cut vertices
+    come back in the same order, each once.
+    """
+    disc = np.full(n, -1, dtype=np.int64)
+    low = np.zeros(n, dtype=np.int64)
+    stack_parent = np.zeros(n, dtype=np.int64)
+    stack_vertex = np.zeros(n, dtype=np.int64)
+    stack_next = np.zeros(n, dtype=np.int64)
+    is_cut = np.zeros(n, dtype=np.bool_)
+    cuts = np.zeros(n, dtype=np.int64)
+    count = 0
+    k = 0
+    for start in range(n):
+        if disc[start] >= 0:
+            continue
+        disc[start] = count
+        low[start] = count
+        count += 1
+        root_children = 0
+        top = 0
+        stack_parent[0] = start
+        stack_vertex[0] = start
+        stack_next[0] = indptr[start]
+        while top >= 0:
+            g = stack_parent[top]
+            p = stack_vertex[top]
+            if stack_next[top] < indptr[p + 1]:
+                c = indices[stack_next[top]]
+                stack_next[top] += 1
+                if c == g:
+                    continue
+                if disc[c] >= 0:
+                    # Back edge
+                    if disc[c] <= disc[p] and disc[c] < low[p]:
+                        low[p] = disc[c]
+                else:
+                    disc[c] = count
+                    low[c] = count
+                    count += 1
+                    top += 1
+                    stack_parent[top] = p
+                    stack_vertex[top] = c
+                    stack_next[top] = indptr[c]
+            else:
+                top -= 1
+                if top >= 1:
+                    if low[p] >= disc[g] and not is_cut[g]:
+                        is_cut[g] = True
+                        cuts[k] = g
+                        k += 1
+                    if low[p] < low[g]:
+                        low[g] = low[p]
+                elif top == 0:
+                    root_children += 1
+        # The root is a cut vertex when its DFS tree has more than one branch
+        if root_children > 1 and not is_cut[start]:
+            is_cut[start] = True
+            cuts[k] = start
+            k += 1
+    return cuts[:k]
+
+# Numba is optional; without it the Hamiltonian search runs as plain Python recursion
+# and articulation points come from NetworkX.
+# No on-disk cache: it records the importing module name, which differs between
+# "graph_algorithms" and package imports of this file.
+try:
+    from numba import njit
+    _hamilton_dfs = njit(_hamilton_dfs)
+    _articulation_points_csr = njit(_articulation_points_csr)
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Static explanations shared by every instance; read-only so no caller can edit them
+_ALGORITHM_EXPLANATIONS = MappingProxyType({
+    "eulerian": MappingProxyType({
+        "name": "Eulerian Path/Cycle",
+        "description": "A path that traverses every edge exactly once",
+        "conditions": MappingProxyType({
+            "cycle": "All vertices have even degree",
+            "path": "Exactly two vertices have odd degree"
+        }),
+        "wilson_insight": "Euler solved the Königsberg bridge problem by realizing that the key is the number of edges meeting at each landmass."
+    }),
+    "hamiltonian": MappingProxyType({
+        "name": "Hamiltonian Path/Cycle", 
+        "description": "A path that visits every vertex exactly once",
+        "conditions": MappingProxyType({
+            "cycle": "Visits all vertices and returns to start",
+            "path": "Visits all vertices exactly once"
+        }),
+        "wilson_insight": "Unlike Eulerian paths, there's no simple condition to determine if a Hamiltonian path exists. This is a much harder problem!"
+    }),
+    "connectivity": MappingProxyType({
+        "name": "Connectivity",
+        "description": "How well-connected a graph is",
+        "conditions": MappingProxyType({
+            "connected": "Every vertex can reach every other vertex",
+            "disconnected": "Some vertices cannot be reached from others"
+        }),
+        "wilson_insight": "Connectivity is fundamental - it tells us whether a graph is 'in one piece' or has separate components."
+    }),
+    "trees": MappingProxyType({
+        "name": "Trees",
+        "description": "Connected graphs with no cycles",
+        "conditions": MappingProxyType({
+            "tree": "Connected and acyclic",
+            "forest": "Collection of trees"
+        }),
+        "wilson_insight": "Trees are the 'skeleton' of connected graphs - remove edges from any connected graph and you get a tree."
+    })
+})
+
+# Stages of Wilson's book in teaching order, shared and read-only
+_LEARNING_PROGRESSION = (
+    MappingProxyType({
+        "stage": 1,
+        "title": "Graph Basics",
+        "concepts": ("vertices", "edges", "degree", "adjacency"),
+        "description": "Start with the fundamental building blocks of graphs."
+    }),
+    MappingProxyType({
+        "stage": 2, 
+        "title": "Connectivity",
+        "concepts": ("connected", "components", "articulation_points"),
+        "description": "Understand how graphs can be connected or disconnected."
+    }),
+    MappingProxyType({
+        "stage": 3,
+        "title": "Special Structures", 
+        "concepts": ("trees", "cycles", "paths"),
+        "description": "Explore fundamental graph structures like trees and cycles."
+    }),
+    MappingProxyType({
+        "stage": 4,
+        "title": "Eulerian Paths",
+        "concepts": ("eulerian_path", "eulerian_cycle", "degree_conditions"),
+        "description": "Learn about paths that traverse every edge exactly once."
+    }),
+    MappingProxyType({
+        "stage": 5,
+        "title": "Hamiltonian Paths",
+        "concepts": ("hamiltonian_path", "hamiltonian_cycle", "np_complete"),
+        "description": "Explore the more complex problem of visiting every vertex exactly once."
+    }),
+    MappingProxyType({
+        "stage": 6,
+        "title": "Advanced Concepts",
+        "concepts": ("planarity", "coloring", "matching"),
+        "description": "Dive into more advanced graph theory concepts."
+    })
+)
 
 class WilsonGraphAlgorithms:
     """
@@ -16,52 +228,35 @@ class WilsonGraphAlgorithms:
     Focuses on understanding rather than optimization.
     """
     
-    def __init__(self):
-        self.algorithm_explanations = {
-            "eulerian": {
-                "name": "Eulerian Path/Cycle",
-                "description": "A path that traverses every edge exactly once",
-                "conditions": {
-                    "cycle": "All vertices have even degree",
-                    "path": "Exactly two vertices have odd degree"
-                },
-                "wilson_insight": "Euler solved the Königsberg bridge problem by realizing that the key is the number of edges meeting at each landmass."
-            },
-            "hamiltonian": {
-                "name": "Hamiltonian Path/Cycle", 
-                "description": "A path that visits every vertex exactly once",
-                "conditions": {
-                    "cycle": "Visits all vertices and returns to start",
-                    "path": "Visits all vertices exactly once"
-                },
-                "wilson_insight": "Unlike Eulerian paths, there's no simple condition to determine if a Hamiltonian path exists. This is a much harder problem!"
-            },
-            "connectivity": {
-                "name": "Connectivity",
-                "description": "How well-connected a graph is",
-                "conditions": {
-                    "connected": "Every vertex can reach every other vertex",
-                    "disconnected": "Some vertices cannot be reached from others"
-                },
-                "wilson_insight": "Connectivity is fundamental - it tells us whether a graph is 'in one piece' or has separate components."
-            },
-            "trees": {
-                "name": "Trees",
-                "description": "Connected graphs with no cycles",
-                "conditions": {
-                    "tree": "Connected and acyclic",
-                    "forest": "Collection of trees"
-                },
-                "wilson_insight": "Trees are the 'skeleton' of connected graphs - remove edges from any connected graph and you get a tree."
-            }
-        }
+    def _degrees(self, graph: nx.Graph) -> Tuple[List, np.ndarray]:
+        """
+        The vertices and their degrees as a vector in the same order, fetched in
+        one pass for the Eulerian and Hamiltonian analyses.
+        """
+        nodes = list(graph.nodes())
+        deg = np.fromiter((d for _, d in graph.degree()), dtype=np.int64, count=len(nodes))
+        return nodes, deg
     
-    def analyze_eulerian_properties(self, graph: nx.Graph) -> Dict:
+    def _eulerian_core(self, graph: nx.Graph) -> Tuple[bool, bool, List]:
+        """
+        Whether an Eulerian path and cycle exist, plus the odd-degree vertices,
+        without building any of the explanatory analysis.
+        """
+        if not self._is_connected(graph):
+            return False, False, []
+        nodes, deg = self._degrees(graph)
+        odd_degree_vertices = [nodes[i] for i in np.flatnonzero(deg & 1).tolist()]
+        odd_count = len(odd_degree_vertices)
+        return odd_count in (0, 2), odd_count == 0, odd_degree_vertices
+    
+    def analyze_eulerian_properties(self, graph: nx.Graph, include_details: bool = True) -> Dict:
         """
         Analyze Eulerian properties following Wilson's educational approach.
         Returns detailed analysis with explanations.
+        
+        With include_details=False the per-vertex "degrees" map is left out.
         """
-        if not nx.is_connected(graph):
+        if not self._is_connected(graph):
             return {
                 "has_eulerian_path": False,
                 "has_eulerian_cycle": False,
@@ -69,16 +264,17 @@ class WilsonGraphAlgorithms:
                 "explanation": "Eulerian paths require the graph to be connected - you must be able to reach every edge from every other edge."
             }
         
-        # Count degrees
-        degrees = dict(graph.degree())
-        odd_degree_vertices = [v for v, d in degrees.items() if d % 2 == 1]
+        nodes, deg = self._degrees(graph)
+        odd_degree_vertices = [nodes[i] for i in np.flatnonzero(deg & 1).tolist()]
         
-        analysis = {
-            "degrees": degrees,
+        analysis = {}
+        if include_details:
+            analysis["degrees"] = dict(zip(nodes, deg.tolist()))
+        analysis.update({
             "odd_degree_count": len(odd_degree_vertices),
             "odd_degree_vertices": odd_degree_vertices,
-            "wilson_insight": self.algorithm_explanations["eulerian"]["wilson_insight"]
-        }
+            "wilson_insight": _ALGORITHM_EXPLANATIONS["eulerian"]["wilson_insight"]
+        })
         
         if len(odd_degree_vertices) == 0:
             analysis.update({
@@ -104,68 +300,81 @@ class WilsonGraphAlgorithms:
         
         return analysis
     
-    def find_eulerian_path(self, graph: nx.Graph) -> Optional[List]:
+    def find_eulerian_path(self, graph: nx.Graph, analysis: Optional[Dict] = None) -> Optional[List]:
         """
         Find an Eulerian path using Hierholzer's algorithm.
         Educational implementation with step-by-step explanation.
+        
+        Pass the result of analyze_eulerian_properties as analysis to avoid recomputing it.
         """
-        analysis = self.analyze_eulerian_properties(graph)
+        if analysis is None:
+            has_path, has_cycle, odd_degree_vertices = self._eulerian_core(graph)
+        else:
+            has_path = analysis["has_eulerian_path"]
+            has_cycle = analysis["has_eulerian_cycle"]
+            odd_degree_vertices = analysis.get("odd_degree_vertices")
         
-        if not analysis["has_eulerian_path"]:
+        if not has_path:
             return None
         
         # Hierholzer's algorithm
-        if analysis["has_eulerian_cycle"]:
+        if has_cycle:
             # Start anywhere for a cycle
             start_vertex = next(iter(graph.nodes()))
         else:
             # Start at an odd-degree vertex for a path
-            start_vertex = analysis["odd_degree_vertices"][0]
+            start_vertex = odd_degree_vertices[0]
         
-        # Create a copy of the graph to modify
-        temp_graph = graph.copy()
-        path = []
-        current_vertex = start_vertex
+        if graph.is_multigraph():
+            return self._hierholzer_multi(graph, start_vertex)
         
-        while temp_graph.edges():
-            # Find a cycle starting from current vertex
-            cycle = [current_vertex]
-            next_vertex = current_vertex
-            
-            while True:
-                # Find an edge from current vertex
-                neighbors = list(temp_graph.neighbors(next_vertex))
-                if not neighbors:
-                    break
-                
-                # Take the first available edge
-                next_vertex = neighbors[0]
-                temp_graph.remove_edge(current_vertex, next_vertex)
-                cycle.append(next_vertex)
-                current_vertex = next_vertex
-                
-                # If we're back to start, we've completed a cycle
-                if next_vertex == start_vertex and len(cycle) > 1:
-                    break
-            
-            # Insert this cycle into the main path
-            if not path:
-                path = cycle
+        # Adjacency sets: removing an edge is two O(1) set operations.
+        # Read the raw dict-of-dicts so no per-vertex view objects are built.
+        adj = {u: set(nbrs) for u, nbrs in graph._adj.items()}
+        
+        # Walk until stuck, then back up; vertices leave the stack in reverse circuit order
+        stack = [start_vertex]
+        circuit = []
+        while stack:
+            u = stack[-1]
+            if adj[u]:
+                v = adj[u].pop()
+                adj[v].discard(u)
+                stack.append(v)
             else:
-                # Find where to insert the cycle
-                for i, vertex in enumerate(path):
-                    if vertex == start_vertex:
-                        path = path[:i] + cycle + path[i+1:]
-                        break
-            
-            # Find next vertex with remaining edges
-            for vertex in path:
-                if temp_graph.degree(vertex) > 0:
-                    current_vertex = vertex
-                    start_vertex = vertex
-                    break
-        
-        return path
+                circuit.append(stack.pop())
+        
+        return circuit[::-1]
+    
+    def _hierholzer_multi(self, graph: nx.MultiGraph, start_vertex) -> List:
+        """
+        Hierholzer's walk for multigraphs: neighbours are counted, so each parallel edge is used once.
+        """
+        adj = {u: Counter() for u in graph.nodes()}
+        for u, v in graph.edges():
+            adj[u][v] += 1
+            if u != v:
+                adj[v][u] += 1
+        
+        def remove(a, b):
+            adj[a][b] -= 1
+            if not adj[a][b]:
+                del adj[a][b]
+        
+        stack = [start_vertex]
+        circuit = []
+        while stack:
+            u = stack[-1]
+            if adj[u]:
+                v = next(iter(adj[u]))
+                remove(u, v)
+                if v != u:
+                    remove(v, u)
+                stack.append(v)
+            else:
+                circuit.append(stack.pop())
+        
+        return circuit[::-1]
     
     def analyze_hamiltonian_properties(self, graph: nx.Graph) -> Dict:
         """
@@ -174,28 +383,41 @@ class WilsonGraphAlgorithms:
         n = len(graph.nodes())
         
         analysis = {
-            "wilson_insight": self.algorithm_explanations["hamiltonian"]["wilson_insight"],
+            "wilson_insight": _ALGORITHM_EXPLANATIONS["hamiltonian"]["wilson_insight"],
             "difficulty": "NP-complete problem - no efficient general solution exists"
         }
         
+        # Degree vector in node order
+        deg = self._degrees(graph)[1]
+        
         # Some necessary conditions
         if n >= 3:
             # Dirac's theorem: if every vertex has degree ≥ n/2, then Hamiltonian cycle exists
-            min_degree = min(graph.degree(v) for v in graph.nodes())
+            min_degree = int(deg.min())
             if min_degree >= n / 2:
                 analysis["dirac_condition"] = True
                 analysis["dirac_explanation"] = f"Every vertex has degree ≥ {n/2}, so a Hamiltonian cycle exists (Dirac's theorem)"
+                
+                # Dirac implies Ore: every pair already has degree sum ≥ n, so skip the pair scan
+                analysis["ore_condition"] = True
+                analysis["ore_explanation"] = "Implied by Dirac's condition - every pair of vertices has degree sum ≥ n, so Hamiltonian cycle exists (Ore's theorem)"
+                return analysis
             else:
                 analysis["dirac_condition"] = False
                 analysis["dirac_explanation"] = f"Minimum degree {min_degree} < {n/2}, so Dirac's theorem doesn't apply"
         
         # Ore's theorem: if for every pair of non-adjacent vertices, sum of degrees ≥ n
         ore_condition = True
-        for u, v in itertools.combinations(graph.nodes(), 2):
-            if not graph.has_edge(u, v):
-                if graph.degree(u) + graph.degree(v) < n:
-                    ore_condition = False
-                    break
+        if n >= 2:
+            A = nx.to_numpy_array(graph, dtype=bool)
+            # Fail fast on sparse graphs: the two lowest-degree vertices are usually non-adjacent
+            i, j = np.argpartition(deg, 1)[:2]
+            if not A[i, j] and deg[i] + deg[j] < n:
+                ore_condition = False
+            else:
+                # Only the complement's edges (upper triangle) constrain the condition
+                rows, cols = np.nonzero(np.triu(~A, k=1))
+                ore_condition = bool((deg[rows] + deg[cols] >= n).all())
         
         analysis["ore_condition"] = ore_condition
         if ore_condition:
@@ -205,45 +427,129 @@ class WilsonGraphAlgorithms:
         
         return analysis
     
-    def find_hamiltonian_path_simple(self, graph: nx.Graph) -> Optional[List]:
+    def find_hamiltonian_path_simple(self, graph: nx.Graph,
+                                     cancel_event: Optional[threading.Event] = None) -> Optional[List]:
         """
-        Simple Hamiltonian path finder for small graphs (≤ 8 vertices).
-        Uses exhaustive search for educational purposes.
+        Simple Hamiltonian path finder for small graphs (≤ 20 vertices with
+        Numba, ≤ HAMILTON_PYTHON_MAX_VERTICES without).
+        Uses a depth-first search where visited vertices and neighbourhoods are
+        bitmasks, so extending a partial path is a single AND. Dead-end
+        (visited, vertex) states are remembered, Held-Karp style, in a dense
+        table indexed by the visited mask, so no state is explored twice.
+        
+        If cancel_event is given and gets set, the search stops and returns None.
         """
         n = len(graph.nodes())
         
-        if n > 8:
+        if n > (20 if _HAVE_NUMBA else HAMILTON_PYTHON_MAX_VERTICES):
             return None  # Too large for exhaustive search
         
         if n == 0:
             return []
         
-        # Try all possible permutations
+        # Relabel to 0..n-1 and store each neighbourhood as an int bitmask
         vertices = list(graph.nodes())
+        idx = {v: i for i, v in enumerate(vertices)}
+        adj = [0] * n
+        for u, v in graph.edges():
+            adj[idx[u]] |= 1 << idx[v]
+            adj[idx[v]] |= 1 << idx[u]
         
-        # Try Hamiltonian cycles first
-        for perm in itertools.permutations(vertices):
-            # Check if this permutation forms a cycle
-            is_cycle = True
-            for i in range(len(perm)):
-                if not graph.has_edge(perm[i], perm[(i + 1) % len(perm)]):
-                    is_cycle = False
-                    break
-            
-            if is_cycle:
-                return list(perm) + [perm[0]]  # Return as cycle
-        
-        # Try Hamiltonian paths
-        for perm in itertools.permutations(vertices):
-            # Check if this permutation forms a path
-            is_path = True
-            for i in range(len(perm) - 1):
-                if not graph.has_edge(perm[i], perm[i + 1]):
-                    is_path = False
-                    break
-            
-            if is_path:
-                return list(perm)
+        if _HAVE_NUMBA and n >= HAMILTON_COMPILED_MIN_VERTICES:
+            return self._find_hamiltonian_compiled(vertices, adj, cancel_event)
+        
+        def dfs(u, visited, depth, path, cycle):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            if depth == n:
+                return not cycle or bool(adj[u] & (1 << path[0]))
+            if (dead[visited] >> u) & 1:
+                return False
+            m = adj[u] & ~visited
+            while m:
+                v = (m & -m).bit_length() - 1
+                m &= m - 1
+                path.append(v)
+                if dfs(v, visited | (1 << v), depth + 1, path, cycle):
+                    return True
+                path.pop()
+            dead[visited] |= 1 << u
+            return False
+        
+        # Try Hamiltonian cycles first - every cycle passes through vertex 0
+        dead = [0] * (1 << n)
+        path = [0]
+        if dfs(0, 1, 1, path, True):
+            return [vertices[i] for i in path] + [vertices[0]]  # Return as cycle
+        
+        # Try Hamiltonian paths from each start; dead ends don't depend on the start
+        dead = [0] * (1 << n)
+        for start in range(n):
+            path = [start]
+            if dfs(start, 1 << start, 1, path, False):
+                return [vertices[i] for i in path]
+        
+        return None
+    
+    def _is_connected(self, graph: nx.Graph) -> bool:
+        """
+        Whether the graph is connected; the empty graph counts as not connected.
+        """
+        return graph.number_of_nodes() > 0 and nx.is_connected(graph)
+    
+    def _articulation_points(self, graph: nx.Graph) -> List:
+        """
+        Articulation points, from the compiled CSR Tarjan for large graphs with
+        vertices labelled 0..n-1 and from NetworkX otherwise.
+        """
+        n = graph.number_of_nodes()
+        if not _HAVE_NUMBA or n < ARTICULATION_COMPILED_MIN_VERTICES or list(graph.nodes()) != list(range(n)):
+            return list(nx.articulation_points(graph))
+        
+        # CSR in the graph's own neighbour order
+        adj = graph._adj
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.fromiter(map(len, adj.values()), dtype=np.int64, count=n))
+        indices = np.fromiter(chain.from_iterable(adj.values()), dtype=np.int64, count=indptr[-1])
+        return _articulation_points_csr(indptr, indices, n).tolist()
+    
+    def _find_hamiltonian_compiled(self, vertices: List, adj: List[int],
+                                   cancel_event: Optional[threading.Event]) -> Optional[List]:
+        """
+        Same search as find_hamiltonian_path_simple, run by the Numba kernel
+        in slices of HAMILTON_STEP_BUDGET steps so cancel_event is still honoured.
+        """
+        n = len(vertices)
+        adj_arr = np.array(adj, dtype=np.int64)
+        
+        def search(start, cycle, dead):
+            path = np.zeros(n, dtype=np.int64)
+            rem = np.zeros(n, dtype=np.int64)
+            path[0] = start
+            rem[0] = adj[start] & ~(1 << start)
+            state = np.array([1, 1 << start], dtype=np.int64)
+            while True:
+                status = _hamilton_dfs(adj_arr, n, cycle, path, rem, state, dead, HAMILTON_STEP_BUDGET)
+                if status == 1:
+                    return [vertices[i] for i in path]
+                if status == 0:
+                    return None
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+        
+        # Try Hamiltonian cycles first - every cycle passes through vertex 0
+        path = search(0, True, np.zeros(1 << n, dtype=np.uint32))
+        if path is not None:
+            return path + [vertices[0]]  # Return as cycle
+        
+        # Try Hamiltonian paths from each start; dead ends don't depend on the start
+        dead = np.zeros(1 << n, dtype=np.uint32)
+        for start in range(n):
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            path = search(start, False, dead)
+            if path is not None:
+                return path
         
         return None
     
@@ -252,8 +558,8 @@ class WilsonGraphAlgorithms:
         Analyze graph connectivity following Wilson's approach.
         """
         analysis = {
-            "is_connected": nx.is_connected(graph),
-            "wilson_insight": self.algorithm_explanations["connectivity"]["wilson_insight"]
+            "is_connected": self._is_connected(graph),
+            "wilson_insight": _ALGORITHM_EXPLANATIONS["connectivity"]["wilson_insight"]
         }
         
         if analysis["is_connected"]:
@@ -267,7 +573,7 @@ class WilsonGraphAlgorithms:
         # Analyze connectivity further
         if analysis["is_connected"]:
             # Find articulation points (cut vertices)
-            articulation_points = list(nx.articulation_points(graph))
+            articulation_points = self._articulation_points(graph)
             analysis["articulation_points"] = articulation_points
             analysis["has_articulation_points"] = len(articulation_points) > 0
             
@@ -282,9 +588,11 @@ class WilsonGraphAlgorithms:
         """
         Analyze tree properties following Wilson's approach.
         """
+        # A tree is connected with exactly n - 1 edges
+        n = graph.number_of_nodes()
         analysis = {
-            "is_tree": nx.is_tree(graph),
-            "wilson_insight": self.algorithm_explanations["trees"]["wilson_insight"]
+            "is_tree": n > 0 and graph.number_of_edges() == n - 1 and self._is_connected(graph),
+            "wilson_insight": _ALGORITHM_EXPLANATIONS["trees"]["wilson_insight"]
         }
         
         if analysis["is_tree"]:
@@ -305,23 +613,43 @@ class WilsonGraphAlgorithms:
             analysis["leaf_explanation"] = f"Vertices {leaves} are leaves (degree 1). Every tree has at least 2 leaves."
             
         else:
-            if not nx.is_connected(graph):
+            if not self._is_connected(graph):
                 analysis["reason"] = "Graph is not connected"
                 analysis["explanation"] = "Trees must be connected - you must be able to reach any vertex from any other vertex."
             else:
-                cycles = list(nx.simple_cycles(graph))
+                # Cyclomatic number m - n + c counts independent cycles without listing them all
+                cycle_count = graph.number_of_edges() - graph.number_of_nodes() + 1
                 analysis["reason"] = "Graph contains cycles"
-                analysis["cycles"] = cycles
-                analysis["explanation"] = f"Trees cannot have cycles. This graph contains {len(cycles)} cycle(s)."
+                # find_cycle yields (u, v) pairs, or (u, v, key) triples on multigraphs
+                cycle = [edge[0] for edge in nx.find_cycle(graph)]
+                analysis["cycle"] = cycle
+                analysis["cycles"] = [cycle]  # kept for callers of the old all-cycles key
+                analysis["cycle_count"] = cycle_count
+                analysis["explanation"] = f"Trees cannot have cycles. This graph contains {cycle_count} independent cycle(s)."
         
         return analysis
     
+    def run_all_analyses(self, graph: nx.Graph) -> Dict[str, Dict]:
+        """
+        Run the Eulerian, Hamiltonian, connectivity and tree analyses together.
+        The four read-only analyses run side by side on a thread pool.
+        """
+        analyses = {
+            "eulerian": self.analyze_eulerian_properties,
+            "hamiltonian": self.analyze_hamiltonian_properties,
+            "connectivity": self.analyze_connectivity,
+            "trees": self.analyze_tree_properties
+        }
+        with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+            futures = {name: executor.submit(fn, graph) for name, fn in analyses.items()}
+            return {name: future.result() for name, future in futures.items()}
+    
     def get_educational_content(self, concept: str) -> Dict:
         """
         Get educational content for a specific concept.
         """
-        if concept in self.algorithm_explanations:
-            return self.algorithm_explanations[concept]
+        if concept in _ALGORITHM_EXPLANATIONS:
+            return _ALGORITHM_EXPLANATIONS[concept]
         else:
             return {
                 "name": "Unknown Concept",
@@ -329,45 +657,8 @@ class WilsonGraphAlgorithms:
                 "wilson_insight": "Check back later for more educational content!"
             }
     
-    def get_learning_progression(self) -> List[Dict]:
+    def get_learning_progression(self) -> Tuple[Mapping, ...]:
         """
         Get the recommended learning progression based on Wilson's book.
         """
-        return [
-            {
-                "stage": 1,
-                "title": "Graph Basics",
-                "concepts": ["vertices", "edges", "degree", "adjacency"],
-                "description": "Start with the fundamental building blocks of graphs."
-            },
-            {
-                "stage": 2, 
-                "title": "Connectivity",
-                "concepts": ["connected", "components", "articulation_points"],
-                "description": "Understand how graphs can be connected or disconnected."
-            },
-            {
-                "stage": 3,
-                "title": "Special Structures", 
-                "concepts": ["trees", "cycles", "paths"],
-                "description": "Explore fundamental graph structures like trees and cycles."
-            },
-            {
-                "stage": 4,
-                "title": "Eulerian Paths",
-                "concepts": ["eulerian_path", "eulerian_cycle", "degree_conditions"],
-                "description": "Learn about paths that traverse every edge exactly once."
-            },
-            {
-                "stage": 5,
-                "title": "Hamiltonian Paths",
-                "concepts": ["hamiltonian_path", "hamiltonian_cycle", "np_complete"],
-                "description": "Explore the more complex problem of visiting every vertex exactly once."
-            },
-            {
-                "stage": 6,
-                "title": "Advanced Concepts",
-                "concepts": ["planarity", "coloring", "matching"],
-                "description": "Dive into more advanced graph theory concepts."
-            }
-        ] 
\ No newline at end of file
+        return _LEARNING_PROGRESSION 
\ No newline at end of file
@@ -9,16 +9,36 @@ This module provides comprehensive analytics for studying:
 - Performance metrics and error analysis
 """
 
+import atexit
+import functools
 import json
+import os
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+try:
+    import ijson
+    _HAVE_IJSON = True
+except ImportError:
+    _HAVE_IJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
 
 @dataclass
 class UserInteraction:
@@ -54,6 +74,287 @@ class CognitiveLoadMetrics:
     performance_level: int  # 1-9 scale
     frustration_level: int  # 1-9 scale
 
+# Repeated string columns (users, sessions, actions, concepts), stored as int32
+# codes into a per-table label list
+CATEGORY = "category"
+
+# Column dtypes for each record type; field names match the dataclasses above
+INTERACTION_SCHEMA = {
+    "timestamp": np.int64,  # time.time_ns()
+    "action_type": CATEGORY,
+    "action_data": object,
+    "session_id": CATEGORY,
+    "user_id": CATEGORY,
+    "learning_stage": np.int64,
+    "time_spent": np.float64
+}
+OUTCOME_SCHEMA = {
+    "user_id": CATEGORY,
+    "session_id": CATEGORY,
+    "concept": CATEGORY,
+    "pre_test_score": np.float64,
+    "post_test_score": np.float64,
+    "time_to_solution": np.float64,
+    "error_count": np.int64,
+    "confidence_level": np.int64
+}
+COGNITIVE_LOAD_SCHEMA = {
+    "user_id": CATEGORY,
+    "session_id": CATEGORY,
+    "task_complexity": np.int8,
+    "mental_effort": np.int8,
+    "time_pressure": np.int8,
+    "performance_level": np.int8,
+    "frustration_level": np.int8
+}
+# Above this many assessments analyze_cognitive_load uses the fused compiled kernel
+COGNITIVE_COMPILED_MIN_RECORDS = 100_000
+# Above this many outcomes analyze_learning_effectiveness summarises scores in one compiled pass
+OUTCOME_COMPILED_MIN_RECORDS = 100_000
+
+# Free-form dict columns, stored as JSON text in Parquet files
+JSON_COLUMNS = ("action_data",)
+
+def as_datetime(ts_ns: int) -> datetime:
+    """Local datetime for a time.time_ns() timestamp, to the microsecond"""
+    return datetime.fromtimestamp(ts_ns // 10**9) + timedelta(microseconds=ts_ns % 10**9 // 1000)
+
+def _datetime_ns(dt: datetime) -> int:
+    return round(dt.timestamp() * 10**6) * 1000
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON for obj; values JSON can't represent are written with str()"""
+    if _HAVE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode()
+
+def _json_loads(data):
+    return orjson.loads(data) if _HAVE_ORJSON else json.loads(data)
+
+def _cognitive_load_sums(complexity, mental, time_p, perf, frust):
+    """
+    Single pass over the cognitive-load columns. Workload is kept as the integer
+    sum mental + time + frustration (three times NASA-TLX), so every accumulator
+    is an exact integer and the Python side does the division.
+    """
+    s_w = s_w2 = s_p = s_p2 = s_wp = s_c = s_c2 = s_wc = 0
+    s_m = s_t = s_f = high = low = 0
+    for i in prange(len(mental)):
+        w = np.int64(mental[i]) + time_p[i] + frust[i]
+        p = np.int64(perf[i])
+        c = np.int64(complexity[i])
+        s_w += w
+        s_w2 += w * w
+        s_p += p
+        s_p2 += p * p
+        s_wp += w * p
+        s_c += c
+        s_c2 += c * c
+        s_wc += w * c
+        s_m += mental[i]
+        s_t += time_p[i]
+        s_f += frust[i]
+        if w > 18:
+            high += 1
+        elif w < 12:
+            low += 1
+    return s_w, s_w2, s_p, s_p2, s_wp, s_c, s_c2, s_wc, s_m, s_t, s_f, high, low
+
+def _welford3(pre, post):
+    """
+    One pass over pre/post scores with Welford's update. Returns rows of
+    (mean, M2, min, max) for pre, post and post - pre, plus how many
+    improvements exceed 0 and 0.2.
+    """
+    summary = np.zeros((3, 4))
+    summary[:, 2] = np.inf
+    summary[:, 3] = -np.inf
+    x = np.empty(3)
+    improved = significant = 0
+    for i in range(len(pre)):
+        x[0] = pre[i]
+        x[1] = post[i]
+        x[2] = post[i] - pre[i]
+        for k in range(3):
+            delta = x[k] - summary[k, 0]
+            summary[k, 0] += delta / (i + 1)
+            summary[k, 1] += delta * (x[k] - summary[k, 0])
+            summary[k, 2] = min(summary[k, 2], x[k])
+            summary[k, 3] = max(summary[k, 3], x[k])
+        if x[2] > 0:
+            improved += 1
+            if x[2] > 0.2:
+                significant += 1
+    return summary, improved, significant
+
+def _session_segments(users: np.ndarray, sessions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group rows by (user, session) code pair. Returns the row order that makes
+    each session one contiguous run, sessions ordered by their first row and
+    rows kept in their original order, and the offset where each run starts.
+    """
+    key = (users.astype(np.int64) << 32) | sessions.astype(np.int64)
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+    is_start = np.r_[True, sorted_key[1:] != sorted_key[:-1]]
+    # Re-sort on each row's session first row to restore first-appearance order
+    first_row = np.empty(len(key), dtype=np.int64)
+    first_row[order] = order[is_start][np.cumsum(is_start) - 1]
+    order = np.argsort(first_row, kind="stable")
+    sorted_first = first_row[order]
+    starts = np.flatnonzero(np.r_[True, sorted_first[1:] != sorted_first[:-1]])
+    return order, starts
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> float:
+    """Pearson r of two equal-length vectors (nan if either is constant)"""
+    a = a - a.mean()
+    b = b - b.mean()
+    return float((a * b).sum() / np.sqrt((a * a).sum() * (b * b).sum()))
+
+def _pearson_from_sums(n, s_x, s_xx, s_y, s_yy, s_xy):
+    cov = n * s_xy - s_x * s_y
+    var = (n * s_xx - s_x * s_x) * (n * s_yy - s_y * s_y)
+    return cov / np.sqrt(var) if var > 0 else np.nan
+
+# Numba is optional; without it cognitive-load stats always use the NumPy path.
+# No on-disk cache, for the same module-name reason as in graph_algorithms.
+try:
+    from numba import njit, prange
+    _cognitive_load_sums = njit(parallel=True, fastmath=True)(_cognitive_load_sums)
+    _welford3 = njit(_welford3)
+    _HAVE_NUMBA = True
+except ImportError:
+    prange = range
+    _HAVE_NUMBA = False
+
+@functools.lru_cache(maxsize=None)
+def _compile_appender(schema: Tuple[Tuple[str, object], ...]):
+    """
+    Source-generate ColumnTable.append for one schema: one keyword per field
+    and a straight-line store into each column, no per-call loop over fields.
+    """
+    lines = [f"def append(self, {', '.join(name for name, _ in schema)}):",
+             "    i = self._size",
+             "    if i == self._capacity:",
+             "        self.reserve(i + 1)",
+             "    columns = self._columns"]
+    for name, dtype in schema:
+        value = f"self._encode({name!r}, {name})" if dtype == CATEGORY else name
+        lines.append(f"    columns[{name!r}][i] = {value}")
+    lines.append("    self._size = i + 1")
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["append"]
+
+class ColumnTable:
+    """
+    Struct-of-arrays record storage: one NumPy array per field, numeric fields
+    in typed buffers and strings/dicts in object arrays. Buffers double in
+    capacity when full, so appends are amortised O(1). CATEGORY columns hold
+    int32 codes; categories[name] lists their labels in first-seen order.
+    """
+    
+    def __init__(self, schema: Dict, capacity: int = 64):
+        self.schema = schema
+        self._capacity = capacity
+        self._size = 0
+        self.categories = {name: [] for name, dtype in schema.items() if dtype == CATEGORY}
+        self._category_codes = {name: {} for name in self.categories}
+        self._columns = {name: np.empty(capacity, dtype=np.int32 if dtype == CATEGORY else dtype)
+                         for name, dtype in schema.items()}
+        self.append = _compile_appender(tuple(schema.items())).__get__(self)
+    
+    @classmethod
+    def from_columns(cls, schema: Dict, columns: Dict[str, np.ndarray]) -> 'ColumnTable':
+        """Build a table around already-loaded column arrays"""
+        size = len(next(iter(columns.values()))) if columns else 0
+        table = cls(schema, capacity=max(size, 64))
+        for name, dtype in schema.items():
+            if dtype == CATEGORY:
+                table._columns[name][:size] = [table._encode(name, value) for value in columns[name]]
+            else:
+                table._columns[name][:size] = np.asarray(columns[name], dtype=dtype)
+        table._size = size
+        return table
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        """View of one column over the stored rows (codes for CATEGORY columns)"""
+        return self._columns[name][:self._size]
+    
+    def _encode(self, name: str, label: str) -> int:
+        codes = self._category_codes[name]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(self.categories[name])
+            self.categories[name].append(label)
+        return code
+    
+    def labels(self, name: str, codes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Decode a CATEGORY column, or the given codes from it, to an object array of labels"""
+        if codes is None:
+            codes = self[name]
+        return np.array(self.categories[name] + [None], dtype=object)[:-1][codes]
+    
+    def reserve(self, capacity: int):
+        """Make room for at least capacity rows, at least doubling when growing"""
+        if capacity <= self._capacity:
+            return
+        self._capacity = max(capacity, 2 * self._capacity)
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+    
+    def append(self, **row):
+        """Append one record given as field=value (replaced per instance by a schema-specific version)"""
+        if self._size == self._capacity:
+            self.reserve(self._size + 1)
+        i = self._size
+        for name, column in self._columns.items():
+            value = row[name]
+            column[i] = self._encode(name, value) if name in self.categories else value
+        self._size = i + 1
+    
+    def to_records(self) -> List[Dict]:
+        """Rows as plain dicts of Python values"""
+        columns = [(name, (self.labels(name) if name in self.categories else self[name]).tolist())
+                   for name in self.schema]
+        return [{name: values[i] for name, values in columns} for i in range(self._size)]
+    
+    def to_frame(self):
+        """Rows as a pandas DataFrame; CATEGORY columns are decoded to their labels"""
+        import pandas as pd
+        return pd.DataFrame({name: self.labels(name) if name in self.categories else self[name].copy()
+                             for name in self.schema})
+
+def _memoized(analysis):
+    """
+    Cache an analyze_* result per set of user_ids until data changes.
+    Callers share the cached dict, so it must be treated as read-only.
+    """
+    @functools.wraps(analysis)
+    def wrapper(self, user_ids: Optional[List[str]] = None) -> Dict:
+        key = (analysis.__name__, tuple(sorted(set(user_ids or ()))), self._version)
+        result = self._analysis_cache.get(key)
+        if result is None:
+            if len(self._analysis_cache) >= 32:
+                self._analysis_cache.clear()
+            result = self._analysis_cache[key] = analysis(self, user_ids)
+        return result
+    return wrapper
+
+# Instances with an open append log, flushed at exit without keeping them alive
+_live_analytics = weakref.WeakSet()
+
+@atexit.register
+def _flush_all():
+    for analytics in list(_live_analytics):
+        analytics.flush()
+
 class LearningAnalytics:
     """
     Comprehensive learning analytics system for educational research
@@ -61,53 +362,202 @@ class LearningAnalytics:
     
     def __init__(self, data_file: str = "data/user_studies/learning_data.json"):
         self.data_file = data_file
-        self.interactions: List[UserInteraction] = []
-        self.outcomes: List[LearningOutcome] = []
-        self.cognitive_load: List[CognitiveLoadMetrics] = []
+        # New records are appended here as NDJSON; save_data() folds them into data_file
+        self.log_file = data_file + ".ndjson"
+        self._log = None
+        # Bumped whenever records change; keys the memoized analyze_* results
+        self._version = 0
+        self._analysis_cache = {}
+        self._interactions = ColumnTable(INTERACTION_SCHEMA)
+        self._outcomes = ColumnTable(OUTCOME_SCHEMA)
+        self._cognitive_load = ColumnTable(COGNITIVE_LOAD_SCHEMA)
         self.load_data()
     
+    def _tables(self) -> Dict[str, ColumnTable]:
+        return {
+            'interactions': self._interactions,
+            'outcomes': self._outcomes,
+            'cognitive_load': self._cognitive_load
+        }
+    
+    @property
+    def interactions(self) -> List[UserInteraction]:
+        """Recorded interactions as dataclasses"""
+        records = self._interactions.to_records()
+        for r in records:
+            r['timestamp'] = as_datetime(r['timestamp'])
+        return [UserInteraction(**r) for r in records]
+    
+    @property
+    def outcomes(self) -> List[LearningOutcome]:
+        """Recorded learning outcomes as dataclasses"""
+        return [LearningOutcome(**r) for r in self._outcomes.to_records()]
+    
+    @property
+    def cognitive_load(self) -> List[CognitiveLoadMetrics]:
+        """Recorded cognitive load assessments as dataclasses"""
+        return [CognitiveLoadMetrics(**r) for r in self._cognitive_load.to_records()]
+    
+    def _parquet_file(self, table: str) -> str:
+        return f"{os.path.splitext(self.data_file)[0]}.{table}.parquet"
+    
+    def _load_parquet(self) -> bool:
+        """Load every table from its Parquet file; False if any file is missing"""
+        paths = {table: self._parquet_file(table) for table in self._tables()}
+        if not all(os.path.exists(path) for path in paths.values()):
+            return False
+        for table, path in paths.items():
+            arrow_table = pq.read_table(path)
+            schema = self._tables()[table].schema
+            columns = {}
+            for name, dtype in schema.items():
+                column = arrow_table.column(name)
+                if dtype is object or dtype == CATEGORY:
+                    values = column.to_pylist()
+                    if name in JSON_COLUMNS:
+                        values = [_json_loads(v) for v in values]
+                    columns[name] = np.array(values + [None], dtype=object)[:-1]
+                else:
+                    columns[name] = column.to_numpy()
+            setattr(self, '_' + table, ColumnTable.from_columns(schema, columns))
+        return True
+    
+    def _save_parquet(self):
+        """Write each table to its own Parquet file"""
+        for table, columns in self._tables().items():
+            arrays = {}
+            for name, dtype in columns.schema.items():
+                if name in JSON_COLUMNS:
+                    arrays[name] = pa.array([_json_bytes(v).decode() for v in columns[name]], pa.string())
+                elif dtype == CATEGORY:
+                    arrays[name] = pa.DictionaryArray.from_arrays(columns[name], columns.categories[name])
+                elif dtype is object:
+                    arrays[name] = pa.array(columns[name].tolist())
+                else:
+                    arrays[name] = pa.array(columns[name])
+            pq.write_table(pa.table(arrays), self._parquet_file(table))
+    
+    def _load_row(self, table: str, row: Dict):
+        if table == 'interactions' and isinstance(row['timestamp'], str):
+            # Older files saved timestamps as datetime strings
+            row['timestamp'] = _datetime_ns(datetime.fromisoformat(row['timestamp']))
+        getattr(self, '_' + table).append(**row)
+    
+    def _load_json_snapshot(self, f):
+        if _HAVE_IJSON:
+            # One streaming pass: the leading "counts" entry reserves each table,
+            # then every "<table>.item" object is built and loaded as it closes
+            tables = self._tables()
+            builder = table = item_prefix = None
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == 'end_map' and prefix == item_prefix:
+                        self._load_row(table, builder.value)
+                        builder = None
+                elif event == 'start_map' and prefix.endswith('.item'):
+                    table = prefix[:-len('.item')]
+                    if table in tables:
+                        item_prefix = prefix
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                elif event == 'number' and prefix.startswith('counts.'):
+                    columns = tables.get(prefix[len('counts.'):])
+                    if columns is not None:
+                        columns.reserve(len(columns) + int(value))
+        else:
+            data = _json_loads(f.read())
+            for table, columns in self._tables().items():
+                rows = data.get(table, [])
+                columns.reserve(len(columns) + len(rows))
+                for row in rows:
+                    self._load_row(table, row)
+    
     def load_data(self):
-        """Load existing data from file"""
-        try:
-            with open(self.data_file, 'r') as f:
-                data = json.load(f)
-                self.interactions = [UserInteraction(**i) for i in data.get('interactions', [])]
-                self.outcomes = [LearningOutcome(**o) for o in data.get('outcomes', [])]
-                self.cognitive_load = [CognitiveLoadMetrics(**c) for c in data.get('cognitive_load', [])]
-        except FileNotFoundError:
+        """Load existing data from file, then replay records appended since the last save"""
+        self.flush()
+        self._version += 1
+        self._interactions = ColumnTable(INTERACTION_SCHEMA)
+        self._outcomes = ColumnTable(OUTCOME_SCHEMA)
+        self._cognitive_load = ColumnTable(COGNITIVE_LOAD_SCHEMA)
+        
+        snapshot_found = _HAVE_PYARROW and self._load_parquet()
+        if not snapshot_found:
+            try:
+                with open(self.data_file, 'rb') as f:
+                    self._load_json_snapshot(f)
+                snapshot_found = True
+            except FileNotFoundError:
+                pass
+        
+        if os.path.exists(self.log_file):
+            with open(self.log_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        row = _json_loads(line)
+                        self._load_row(row.pop('table'), row)
+        
+        if not snapshot_found:
             # Create new file if it doesn't exist
             self.save_data()
     
     def save_data(self):
-        """Save data to file"""
-        data = {
-            'interactions': [asdict(i) for i in self.interactions],
-            'outcomes': [asdict(o) for o in self.outcomes],
-            'cognitive_load': [asdict(c) for c in self.cognitive_load]
-        }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        """Save all data to file and clear the append log"""
+        if _HAVE_PYARROW:
+            self._save_parquet()
+        else:
+            tables = self._tables()
+            # Row counts come first so a streaming load can reserve before the rows arrive
+            data = {'counts': {table: len(columns) for table, columns in tables.items()}}
+            data.update((table, columns.to_records()) for table, columns in tables.items())
+            with open(self.data_file, 'wb') as f:
+                f.write(_json_bytes(data, indent=True))
+        
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if os.path.exists(self.log_file):
+            os.remove(self.log_file)
+    
+    def flush(self):
+        """Write buffered records to the append log"""
+        if self._log is not None:
+            self._log.flush()
+    
+    def close(self):
+        """Flush and close the append log; later records reopen it"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        _live_analytics.discard(self)
+    
+    def _append(self, table: str, row: Dict):
+        """Store one record and append it to the log as a JSON line"""
+        getattr(self, '_' + table).append(**row)
+        self._version += 1
+        if self._log is None:
+            self._log = open(self.log_file, 'ab', buffering=1 << 20)
+            _live_analytics.add(self)
+        self._log.write(_json_bytes({'table': table, **row}) + b'\n')
     
     def record_interaction(self, user_id: str, session_id: str, action_type: str, 
                           action_data: Dict, learning_stage: int, time_spent: float):
         """Record a user interaction"""
-        interaction = UserInteraction(
-            timestamp=datetime.now(),
+        self._append('interactions', dict(
+            timestamp=time.time_ns(),
             action_type=action_type,
             action_data=action_data,
             session_id=session_id,
             user_id=user_id,
             learning_stage=learning_stage,
             time_spent=time_spent
-        )
-        self.interactions.append(interaction)
-        self.save_data()
+        ))
     
     def record_learning_outcome(self, user_id: str, session_id: str, concept: str,
                                pre_score: float, post_score: float, time_to_solution: float,
                                error_count: int, confidence: int):
         """Record learning outcome data"""
-        outcome = LearningOutcome(
+        self._append('outcomes', dict(
             user_id=user_id,
             session_id=session_id,
             concept=concept,
@@ -116,15 +566,13 @@ class LearningAnalytics:
             time_to_solution=time_to_solution,
             error_count=error_count,
             confidence_level=confidence
-        )
-        self.outcomes.append(outcome)
-        self.save_data()
+        ))
     
     def record_cognitive_load(self, user_id: str, session_id: str, task_complexity: int,
                              mental_effort: int, time_pressure: int, performance: int,
                              frustration: int):
         """Record cognitive load metrics"""
-        cognitive = CognitiveLoadMetrics(
+        self._append('cognitive_load', dict(
             user_id=user_id,
             session_id=session_id,
             task_complexity=task_complexity,
@@ -132,65 +580,80 @@ class LearningAnalytics:
             time_pressure=time_pressure,
             performance_level=performance,
             frustration_level=frustration
-        )
-        self.cognitive_load.append(cognitive)
-        self.save_data()
+        ))
+    
+    def _select(self, table: ColumnTable, user_ids: Optional[List[str]]) -> Dict[str, np.ndarray]:
+        """Columns of a table, restricted to the given users when user_ids is set"""
+        columns = {name: table[name] for name in table.schema}
+        if user_ids:
+            wanted = [code for code, user in enumerate(table.categories["user_id"]) if user in user_ids]
+            mask = np.isin(columns["user_id"], wanted)
+            columns = {name: column[mask] for name, column in columns.items()}
+        return columns
     
+    @_memoized
     def analyze_learning_effectiveness(self, user_ids: Optional[List[str]] = None) -> Dict:
         """
         Analyze learning effectiveness across users
         Returns comprehensive learning analytics
         """
-        if user_ids:
-            outcomes = [o for o in self.outcomes if o.user_id in user_ids]
-        else:
-            outcomes = self.outcomes
+        cols = self._select(self._outcomes, user_ids)
         
-        if not outcomes:
+        if not len(cols["user_id"]):
             return {"error": "No learning outcome data available"}
         
-        # Calculate improvement scores
-        improvements = [o.post_test_score - o.pre_test_score for o in outcomes]
+        # Calculate improvement scores: rows of mean, std, min, max for pre, post, improvement
+        pre = cols["pre_test_score"]
+        post = cols["post_test_score"]
+        if _HAVE_NUMBA and len(pre) >= OUTCOME_COMPILED_MIN_RECORDS:
+            summary, improved, significant = _welford3(pre, post)
+            summary[:, 1] = np.sqrt(summary[:, 1] / len(pre))
+            improvement_rate = improved / len(pre)
+            significant_rate = significant / len(pre)
+        else:
+            improvements = post - pre
+            summary = np.array([[v.mean(), v.std(), v.min(), v.max()] for v in (pre, post, improvements)])
+            improvement_rate = float((improvements > 0).mean())
+            significant_rate = float((improvements > 0.2).mean())
         
         # Statistical analysis
         analysis = {
-            "total_participants": len(set(o.user_id for o in outcomes)),
-            "total_sessions": len(set(o.session_id for o in outcomes)),
-            "concepts_covered": list(set(o.concept for o in outcomes)),
+            "total_participants": len(np.unique(cols["user_id"])),
+            "total_sessions": len(np.unique(cols["session_id"])),
+            "concepts_covered": self._outcomes.labels("concept", np.unique(cols["concept"])).tolist(),
             
             "pre_test_stats": {
-                "mean": np.mean([o.pre_test_score for o in outcomes]),
-                "std": np.std([o.pre_test_score for o in outcomes]),
-                "min": np.min([o.pre_test_score for o in outcomes]),
-                "max": np.max([o.pre_test_score for o in outcomes])
+                "mean": summary[0, 0],
+                "std": summary[0, 1],
+                "min": summary[0, 2],
+                "max": summary[0, 3]
             },
             
             "post_test_stats": {
-                "mean": np.mean([o.post_test_score for o in outcomes]),
-                "std": np.std([o.post_test_score for o in outcomes]),
-                "min": np.min([o.post_test_score for o in outcomes]),
-                "max": np.max([o.post_test_score for o in outcomes])
+                "mean": summary[1, 0],
+                "std": summary[1, 1],
+                "min": summary[1, 2],
+                "max": summary[1, 3]
             },
             
             "improvement_stats": {
-                "mean_improvement": np.mean(improvements),
-                "std_improvement": np.std(improvements),
-                "improvement_rate": len([i for i in improvements if i > 0]) / len(improvements),
-                "significant_improvement": len([i for i in improvements if i > 0.2]) / len(improvements)
+                "mean_improvement": summary[2, 0],
+                "std_improvement": summary[2, 1],
+                "improvement_rate": improvement_rate,
+                "significant_improvement": significant_rate
             },
             
             "performance_metrics": {
-                "avg_time_to_solution": np.mean([o.time_to_solution for o in outcomes]),
-                "avg_error_count": np.mean([o.error_count for o in outcomes]),
-                "avg_confidence": np.mean([o.confidence_level for o in outcomes])
+                "avg_time_to_solution": cols["time_to_solution"].mean(),
+                "avg_error_count": cols["error_count"].mean(),
+                "avg_confidence": cols["confidence_level"].mean()
             }
         }
         
         # Statistical significance test
-        if len(outcomes) > 1:
-            pre_scores = [o.pre_test_score for o in outcomes]
-            post_scores = [o.post_test_score for o in outcomes]
-            t_stat, p_value = stats.ttest_rel(pre_scores, post_scores)
+        if len(pre) > 1:
+            from scipy import stats
+            t_stat, p_value = stats.ttest_rel(pre, post)
             analysis["statistical_significance"] = {
                 "t_statistic": t_stat,
                 "p_value": p_value,
@@ -199,56 +662,60 @@ class LearningAnalytics:
         
         return analysis
     
+    @_memoized
     def analyze_interaction_patterns(self, user_ids: Optional[List[str]] = None) -> Dict:
         """
         Analyze user interaction patterns
         Returns interaction analytics and insights
         """
-        if user_ids:
-            interactions = [i for i in self.interactions if i.user_id in user_ids]
-        else:
-            interactions = self.interactions
+        cols = self._select(self._interactions, user_ids)
         
-        if not interactions:
+        if not len(cols["user_id"]):
             return {"error": "No interaction data available"}
         
-        # Group by user and session
-        user_sessions = {}
-        for interaction in interactions:
-            key = (interaction.user_id, interaction.session_id)
-            if key not in user_sessions:
-                user_sessions[key] = []
-            user_sessions[key].append(interaction)
+        order, starts = _session_segments(cols["user_id"], cols["session_id"])
         
         # Analyze patterns
-        session_durations = []
-        action_counts = {}
-        stage_progression = {}
+        timestamps = cols["timestamp"][order]
+        session_durations = (np.maximum.reduceat(timestamps, starts)
+                             - np.minimum.reduceat(timestamps, starts)) / 1e9
         
-        for (user_id, session_id), session_interactions in user_sessions.items():
-            # Session duration
-            start_time = min(i.timestamp for i in session_interactions)
-            end_time = max(i.timestamp for i in session_interactions)
-            duration = (end_time - start_time).total_seconds()
-            session_durations.append(duration)
-            
-            # Action counts
-            for interaction in session_interactions:
-                action_counts[interaction.action_type] = action_counts.get(interaction.action_type, 0) + 1
-            
-            # Stage progression
-            stages = [i.learning_stage for i in session_interactions]
+        # Count actions by code; list them in first-seen order session by session
+        # so ties in most_common_action resolve as before
+        actions = cols["action_type"]
+        counts = np.bincount(actions)
+        codes, first_seen = np.unique(actions[order], return_index=True)
+        codes = codes[np.argsort(first_seen)]
+        action_counts = dict(zip(self._interactions.labels("action_type", codes).tolist(),
+                                 counts[codes].tolist()))
+        
+        stages = cols["learning_stage"][order]
+        start_stages = np.minimum.reduceat(stages, starts)
+        end_stages = np.maximum.reduceat(stages, starts)
+        # Distinct stages per session: sort stages within each run, count changes
+        session_of_row = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(stages)]))
+        ranked = stages[np.lexsort((stages, session_of_row))]
+        is_new = np.r_[True, (ranked[1:] != ranked[:-1]) | (session_of_row[1:] != session_of_row[:-1])]
+        stages_covered = np.add.reduceat(is_new, starts)
+        
+        first_rows = order[starts]
+        user_labels = self._interactions.labels("user_id", cols["user_id"][first_rows]).tolist()
+        session_labels = self._interactions.labels("session_id", cols["session_id"][first_rows]).tolist()
+        stage_progression = {}
+        for user_id, session_id, start, end, covered, sequence in zip(
+                user_labels, session_labels, start_stages.tolist(), end_stages.tolist(),
+                stages_covered.tolist(), np.split(stages, starts[1:])):
             stage_progression[f"{user_id}_{session_id}"] = {
-                "start_stage": min(stages),
-                "end_stage": max(stages),
-                "stages_covered": len(set(stages)),
-                "stage_sequence": stages
+                "start_stage": start,
+                "end_stage": end,
+                "stages_covered": covered,
+                "stage_sequence": sequence.tolist()
             }
         
         analysis = {
-            "total_interactions": len(interactions),
-            "unique_users": len(set(i.user_id for i in interactions)),
-            "total_sessions": len(user_sessions),
+            "total_interactions": len(actions),
+            "unique_users": len(np.unique(cols["user_id"])),
+            "total_sessions": len(session_durations),
             
             "session_analytics": {
                 "avg_session_duration": np.mean(session_durations),
@@ -267,67 +734,111 @@ class LearningAnalytics:
                 "avg_stages_covered": np.mean([s["stages_covered"] for s in stage_progression.values()]),
                 "users_reaching_advanced_stages": len([s for s in stage_progression.values() if s["end_stage"] >= 4]),
                 "stage_progression_patterns": stage_progression
+            },
+            
+            # Per-session arrays for plotting; kept out of the report
+            "_raw": {
+                "session_durations": session_durations
             }
         }
         
         return analysis
     
+    @_memoized
     def analyze_cognitive_load(self, user_ids: Optional[List[str]] = None) -> Dict:
         """
         Analyze cognitive load patterns
         Returns cognitive load analytics
         """
-        if user_ids:
-            cognitive_data = [c for c in self.cognitive_load if c.user_id in user_ids]
-        else:
-            cognitive_data = self.cognitive_load
+        cols = self._select(self._cognitive_load, user_ids)
         
-        if not cognitive_data:
+        if not len(cols["user_id"]):
             return {"error": "No cognitive load data available"}
         
+        if _HAVE_NUMBA and len(cols["user_id"]) >= COGNITIVE_COMPILED_MIN_RECORDS:
+            return self._cognitive_load_compiled(cols)
+        
+        # One (N, 5) matrix: complexity, mental effort, time pressure, performance, frustration
+        loads = np.column_stack([cols["task_complexity"], cols["mental_effort"], cols["time_pressure"],
+                                 cols["performance_level"], cols["frustration_level"]])
+        means = loads.mean(axis=0)
+        
         # Calculate NASA-TLX workload index
-        workload_scores = []
-        for data in cognitive_data:
-            # NASA-TLX formula: (mental_effort + time_pressure + frustration) / 3
-            workload = (data.mental_effort + data.time_pressure + data.frustration_level) / 3
-            workload_scores.append(workload)
+        # NASA-TLX formula: (mental_effort + time_pressure + frustration) / 3
+        workload_scores = (loads[:, 1].astype(np.float64) + loads[:, 2] + loads[:, 4]) / 3
         
         analysis = {
-            "total_assessments": len(cognitive_data),
-            "unique_users": len(set(c.user_id for c in cognitive_data)),
+            "total_assessments": len(workload_scores),
+            "unique_users": len(np.unique(cols["user_id"])),
             
             "workload_analytics": {
-                "avg_workload": np.mean(workload_scores),
-                "std_workload": np.std(workload_scores),
-                "high_workload_sessions": len([w for w in workload_scores if w > 6]),
-                "low_workload_sessions": len([w for w in workload_scores if w < 4])
+                "avg_workload": workload_scores.mean(),
+                "std_workload": workload_scores.std(),
+                "high_workload_sessions": int((workload_scores > 6).sum()),
+                "low_workload_sessions": int((workload_scores < 4).sum())
             },
             
             "component_analytics": {
-                "avg_mental_effort": np.mean([c.mental_effort for c in cognitive_data]),
-                "avg_time_pressure": np.mean([c.time_pressure for c in cognitive_data]),
-                "avg_frustration": np.mean([c.frustration_level for c in cognitive_data]),
-                "avg_performance": np.mean([c.performance_level for c in cognitive_data])
+                "avg_mental_effort": means[1],
+                "avg_time_pressure": means[2],
+                "avg_frustration": means[4],
+                "avg_performance": means[3]
             },
             
             "correlation_analysis": {
-                "workload_vs_performance": np.corrcoef(workload_scores, 
-                                                      [c.performance_level for c in cognitive_data])[0, 1],
-                "complexity_vs_workload": np.corrcoef([c.task_complexity for c in cognitive_data], 
-                                                     workload_scores)[0, 1]
+                "workload_vs_performance": _pearson(workload_scores, loads[:, 3].astype(np.float64)),
+                "complexity_vs_workload": _pearson(loads[:, 0].astype(np.float64), workload_scores)
             }
         }
         
         return analysis
     
+    def _cognitive_load_compiled(self, cols: Dict[str, np.ndarray]) -> Dict:
+        """analyze_cognitive_load for large N from one fused pass over the columns"""
+        n = len(cols["user_id"])
+        (s_w, s_w2, s_p, s_p2, s_wp, s_c, s_c2, s_wc,
+         s_m, s_t, s_f, high, low) = (float(v) for v in _cognitive_load_sums(
+            cols["task_complexity"], cols["mental_effort"], cols["time_pressure"],
+            cols["performance_level"], cols["frustration_level"]))
+        avg_workload = s_w / (3 * n)
+        
+        return {
+            "total_assessments": n,
+            "unique_users": len(np.unique(cols["user_id"])),
+            
+            "workload_analytics": {
+                "avg_workload": avg_workload,
+                "std_workload": np.sqrt(max(s_w2 / (9 * n) - avg_workload ** 2, 0.0)),
+                "high_workload_sessions": int(high),
+                "low_workload_sessions": int(low)
+            },
+            
+            "component_analytics": {
+                "avg_mental_effort": s_m / n,
+                "avg_time_pressure": s_t / n,
+                "avg_frustration": s_f / n,
+                "avg_performance": s_p / n
+            },
+            
+            "correlation_analysis": {
+                "workload_vs_performance": _pearson_from_sums(n, s_w, s_w2, s_p, s_p2, s_wp),
+                "complexity_vs_workload": _pearson_from_sums(n, s_w, s_w2, s_c, s_c2, s_wc)
+            }
+        }
+    
     def generate_research_report(self, output_file: str = "data/research_report.md") -> str:
         """
         Generate comprehensive research report
         Returns markdown-formatted research report
         """
-        learning_analysis = self.analyze_learning_effectiveness()
-        interaction_analysis = self.analyze_interaction_patterns()
-        cognitive_analysis = self.analyze_cognitive_load()
+        # The analyses read separate tables, so they can run side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            learning_future = executor.submit(self.analyze_learning_effectiveness)
+            interaction_future = executor.submit(self.analyze_interaction_patterns)
+            cognitive_future = executor.submit(self.analyze_cognitive_load)
+            learning_analysis = learning_future.result()
+            interaction_analysis = interaction_future.result()
+            cognitive_analysis = cognitive_future.result()
         
         report = f"""# Learning Analytics Research Report
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -415,123 +926,113 @@ The average cognitive workload of {cognitive_analysis.get('workload_analytics',
         """
         Create comprehensive visualizations of the analytics data
         """
-        import os
+        import matplotlib.pyplot as plt
         os.makedirs(output_dir, exist_ok=True)
         
+        # One figure, cleared and redrawn for each PNG
+        fig = plt.figure(figsize=(12, 8))
+        
         # Learning effectiveness visualization
-        if self.outcomes:
-            plt.figure(figsize=(12, 8))
+        if len(self._outcomes):
+            fig.clear()
             
             # Pre vs Post test scores
-            plt.subplot(2, 2, 1)
-            pre_scores = [o.pre_test_score for o in self.outcomes]
-            post_scores = [o.post_test_score for o in self.outcomes]
-            plt.scatter(pre_scores, post_scores, alpha=0.6)
-            plt.plot([0, 1], [0, 1], 'r--', alpha=0.5)
-            plt.xlabel('Pre-test Score')
-            plt.ylabel('Post-test Score')
-            plt.title('Learning Effectiveness: Pre vs Post Test Scores')
+            ax = fig.add_subplot(2, 2, 1)
+            pre_scores = self._outcomes["pre_test_score"]
+            post_scores = self._outcomes["post_test_score"]
+            ax.scatter(pre_scores, post_scores, alpha=0.6)
+            ax.plot([0, 1], [0, 1], 'r--', alpha=0.5)
+            ax.set_xlabel('Pre-test Score')
+            ax.set_ylabel('Post-test Score')
+            ax.set_title('Learning Effectiveness: Pre vs Post Test Scores')
             
             # Improvement distribution
-            plt.subplot(2, 2, 2)
-            improvements = [o.post_test_score - o.pre_test_score for o in self.outcomes]
-            plt.hist(improvements, bins=20, alpha=0.7)
-            plt.xlabel('Score Improvement')
-            plt.ylabel('Frequency')
-            plt.title('Distribution of Learning Improvements')
+            ax = fig.add_subplot(2, 2, 2)
+            improvements = post_scores - pre_scores
+            ax.hist(improvements, bins=20, alpha=0.7)
+            ax.set_xlabel('Score Improvement')
+            ax.set_ylabel('Frequency')
+            ax.set_title('Distribution of Learning Improvements')
             
             # Time to solution vs improvement
-            plt.subplot(2, 2, 3)
-            plt.scatter([o.time_to_solution for o in self.outcomes], improvements, alpha=0.6)
-            plt.xlabel('Time to Solution (seconds)')
-            plt.ylabel('Score Improvement')
-            plt.title('Time vs Learning Improvement')
+            ax = fig.add_subplot(2, 2, 3)
+            ax.scatter(self._outcomes["time_to_solution"], improvements, alpha=0.6)
+            ax.set_xlabel('Time to Solution (seconds)')
+            ax.set_ylabel('Score Improvement')
+            ax.set_title('Time vs Learning Improvement')
             
             # Error count vs improvement
-            plt.subplot(2, 2, 4)
-            plt.scatter([o.error_count for o in self.outcomes], improvements, alpha=0.6)
-            plt.xlabel('Error Count')
-            plt.ylabel('Score Improvement')
-            plt.title('Errors vs Learning Improvement')
+            ax = fig.add_subplot(2, 2, 4)
+            ax.scatter(self._outcomes["error_count"], improvements, alpha=0.6)
+            ax.set_xlabel('Error Count')
+            ax.set_ylabel('Score Improvement')
+            ax.set_title('Errors vs Learning Improvement')
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}learning_effectiveness.png", dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            fig.savefig(f"{output_dir}learning_effectiveness.png", dpi=300, bbox_inches='tight')
         
         # Interaction patterns visualization
-        if self.interactions:
-            plt.figure(figsize=(12, 8))
+        if len(self._interactions):
+            fig.clear()
             
             # Action frequency
-            plt.subplot(2, 2, 1)
-            action_counts = {}
-            for interaction in self.interactions:
-                action_counts[interaction.action_type] = action_counts.get(interaction.action_type, 0) + 1
+            ax = fig.add_subplot(2, 2, 1)
+            # Codes are assigned in first-seen order, so this keeps the bar order
+            action_counts = dict(zip(self._interactions.categories["action_type"],
+                                     np.bincount(self._interactions["action_type"]).tolist()))
             
-            plt.bar(action_counts.keys(), action_counts.values())
-            plt.xlabel('Action Type')
-            plt.ylabel('Frequency')
-            plt.title('User Interaction Patterns')
-            plt.xticks(rotation=45)
+            ax.bar(action_counts.keys(), action_counts.values())
+            ax.set_xlabel('Action Type')
+            ax.set_ylabel('Frequency')
+            ax.set_title('User Interaction Patterns')
+            ax.tick_params(axis='x', rotation=45)
             
             # Session duration distribution
-            plt.subplot(2, 2, 2)
-            session_durations = []
-            user_sessions = {}
-            for interaction in self.interactions:
-                key = (interaction.user_id, interaction.session_id)
-                if key not in user_sessions:
-                    user_sessions[key] = []
-                user_sessions[key].append(interaction)
-            
-            for session_interactions in user_sessions.values():
-                start_time = min(i.timestamp for i in session_interactions)
-                end_time = max(i.timestamp for i in session_interactions)
-                duration = (end_time - start_time).total_seconds()
-                session_durations.append(duration)
+            ax = fig.add_subplot(2, 2, 2)
+            session_durations = self.analyze_interaction_patterns()["_raw"]["session_durations"]
             
-            plt.hist(session_durations, bins=20, alpha=0.7)
-            plt.xlabel('Session Duration (seconds)')
-            plt.ylabel('Frequency')
-            plt.title('Session Duration Distribution')
+            ax.hist(session_durations, bins=20, alpha=0.7)
+            ax.set_xlabel('Session Duration (seconds)')
+            ax.set_ylabel('Frequency')
+            ax.set_title('Session Duration Distribution')
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}interaction_patterns.png", dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            fig.savefig(f"{output_dir}interaction_patterns.png", dpi=300, bbox_inches='tight')
         
         # Cognitive load visualization
-        if self.cognitive_load:
-            plt.figure(figsize=(12, 8))
+        if len(self._cognitive_load):
+            fig.clear()
             
             # Workload distribution
-            plt.subplot(2, 2, 1)
-            workload_scores = []
-            for data in self.cognitive_load:
-                workload = (data.mental_effort + data.time_pressure + data.frustration_level) / 3
-                workload_scores.append(workload)
+            ax = fig.add_subplot(2, 2, 1)
+            workload_scores = (self._cognitive_load["mental_effort"].astype(np.float64)
+                               + self._cognitive_load["time_pressure"]
+                               + self._cognitive_load["frustration_level"]) / 3
             
-            plt.hist(workload_scores, bins=15, alpha=0.7)
-            plt.xlabel('NASA-TLX Workload Score')
-            plt.ylabel('Frequency')
-            plt.title('Cognitive Workload Distribution')
+            ax.hist(workload_scores, bins=15, alpha=0.7)
+            ax.set_xlabel('NASA-TLX Workload Score')
+            ax.set_ylabel('Frequency')
+            ax.set_title('Cognitive Workload Distribution')
             
-            # Component analysis
-            plt.subplot(2, 2, 2)
+            # Component analysis, from the memoized analysis
+            ax = fig.add_subplot(2, 2, 2)
+            means = self.analyze_cognitive_load()["component_analytics"]
             components = ['Mental Effort', 'Time Pressure', 'Performance', 'Frustration']
             values = [
-                np.mean([c.mental_effort for c in self.cognitive_load]),
-                np.mean([c.time_pressure for c in self.cognitive_load]),
-                np.mean([c.performance_level for c in self.cognitive_load]),
-                np.mean([c.frustration_level for c in self.cognitive_load])
+                means["avg_mental_effort"],
+                means["avg_time_pressure"],
+                means["avg_performance"],
+                means["avg_frustration"]
             ]
-            plt.bar(components, values)
-            plt.ylabel('Average Score')
-            plt.title('Cognitive Load Components')
-            plt.xticks(rotation=45)
+            ax.bar(components, values)
+            ax.set_ylabel('Average Score')
+            ax.set_title('Cognitive Load Components')
+            ax.tick_params(axis='x', rotation=45)
             
-            plt.tight_layout()
-            plt.savefig(f"{output_dir}cognitive_load.png", dpi=300, bbox_inches='tight')
-            plt.close()
+            fig.tight_layout()
+            fig.savefig(f"{output_dir}cognitive_load.png", dpi=300, bbox_inches='tight')
+        
+        plt.close(fig)
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -3,9 +3,21 @@
 Test script for the Graph Theory Visualizer
 """
 
+import os
 import sys
 import traceback
 
+try:
+    import matplotlib
+    matplotlib.use('Agg')  # No GUI backend needed to build test figures
+except ImportError:
+    pass
+
+# The algorithm and analytics modules are plain files, not packages
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for _subdir in ("core/algorithms", "research/metrics"):
+    sys.path.insert(0, os.path.join(ROOT, _subdir))
+
 def test_imports():
     """Test if all required modules can be imported"""
     print("Testing imports...")
@@ -90,10 +102,268 @@ def test_graph_creation():
         traceback.print_exc()
         return False
 
+def _has_hamiltonian(graph, cycle):
+    """Held-Karp reference: is there a Hamiltonian path (or cycle) in graph?"""
+    vertices = list(graph.nodes())
+    n = len(vertices)
+    if n == 0:
+        return True
+    if cycle and n < 3:
+        return False
+    idx = {v: i for i, v in enumerate(vertices)}
+    adj = [0] * n
+    for u, v in graph.edges():
+        if u != v:
+            adj[idx[u]] |= 1 << idx[v]
+            adj[idx[v]] |= 1 << idx[u]
+    # reach[mask] = bitmask of end vertices of paths covering exactly mask
+    reach = [0] * (1 << n)
+    starts = [0] if cycle else range(n)
+    for s in starts:
+        reach[1 << s] |= 1 << s
+    for mask in range(1, 1 << n):
+        ends = reach[mask]
+        while ends:
+            u = (ends & -ends).bit_length() - 1
+            ends &= ends - 1
+            nxt = adj[u] & ~mask
+            while nxt:
+                v = (nxt & -nxt).bit_length() - 1
+                nxt &= nxt - 1
+                reach[mask | (1 << v)] |= 1 << v
+    full = reach[(1 << n) - 1]
+    if cycle:
+        return bool(full & adj[0])
+    return bool(full)
+
+def test_path_algorithms():
+    """Compare Hamiltonian and Eulerian results against reference answers"""
+    print("\nTesting path algorithms against reference answers...")
+    
+    try:
+        import random
+        from collections import Counter
+        import networkx as nx
+        import graph_algorithms
+        
+        algorithms = graph_algorithms.WilsonGraphAlgorithms()
+        rng = random.Random(2024)
+        
+        graphs = []
+        for seed in range(150):
+            n = rng.randint(1, 14)
+            graphs.append(nx.gnp_random_graph(n, rng.random(), seed=seed))
+            multi = nx.MultiGraph(graphs[-1])
+            multi.add_edges_from(rng.sample(list(graphs[-1].edges()), min(3, graphs[-1].number_of_edges())))
+            graphs.append(multi)
+        graphs.append(nx.disjoint_union(nx.cycle_graph(4), nx.cycle_graph(5)))
+        graphs.append(nx.complete_bipartite_graph(5, 7))
+        graphs.append(nx.MultiGraph([(0, 1), (0, 1), (1, 2)]))
+        
+        modes = [False, True] if graph_algorithms._HAVE_NUMBA else [False]
+        have_numba = graph_algorithms._HAVE_NUMBA
+        try:
+            for use_numba in modes:
+                graph_algorithms._HAVE_NUMBA = use_numba
+                limit = 20 if use_numba else graph_algorithms.HAMILTON_PYTHON_MAX_VERTICES
+                label = "Numba" if use_numba else "pure-Python"
+                
+                for graph in graphs:
+                    trees = algorithms.analyze_tree_properties(graph)
+                    if "cycle" in trees:
+                        cycle = trees["cycle"]
+                        assert all(graph.has_edge(u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1])), f"cycle {cycle} uses a missing edge"
+                        assert trees["cycle_count"] == graph.number_of_edges() - graph.number_of_nodes() + 1
+                    
+                    path = algorithms.find_eulerian_path(graph)
+                    expected = graph.number_of_nodes() > 0 and nx.has_eulerian_path(graph)
+                    assert (path is not None) == expected, f"Eulerian existence differs from NetworkX for {list(graph.edges())}"
+                    if path is not None:
+                        used = Counter(frozenset(e) for e in zip(path, path[1:]))
+                        assert used == Counter(frozenset(e) for e in graph.edges()), f"Eulerian path {path} does not use every edge once"
+                    
+                    n = graph.number_of_nodes()
+                    path = algorithms.find_hamiltonian_path_simple(graph)
+                    if n > limit:
+                        assert path is None, "search above the size limit should be refused"
+                        continue
+                    if path is None:
+                        assert not _has_hamiltonian(graph, cycle=False), f"missed a Hamiltonian path in {list(graph.edges())}"
+                        continue
+                    is_cycle = n > 1 and len(path) == n + 1
+                    walk = path[:-1] if is_cycle else path
+                    assert sorted(walk) == sorted(graph.nodes()), f"path {path} does not visit every vertex once"
+                    assert all(graph.has_edge(u, v) for u, v in zip(path, path[1:])), f"path {path} uses a missing edge"
+                    # A cycle is preferred, so returning an open path means none exists
+                    assert is_cycle or not _has_hamiltonian(graph, cycle=True), f"missed a Hamiltonian cycle in {list(graph.edges())}"
+                    
+                print(f"✓ {label} results match the reference on {len(graphs)} graphs")
+        finally:
+            graph_algorithms._HAVE_NUMBA = have_numba
+    except Exception as e:
+        print(f"✗ Path algorithm test failed: {e}")
+        traceback.print_exc()
+        raise
+
+def test_articulation_points():
+    """Compare the CSR articulation points with NetworkX on large graphs"""
+    print("\nTesting articulation points on large graphs...")
+    
+    try:
+        import networkx as nx
+        import graph_algorithms
+        
+        if not graph_algorithms._HAVE_NUMBA:
+            print("✓ Skipped (Numba not installed, NetworkX is used directly)")
+            return
+        
+        algorithms = graph_algorithms.WilsonGraphAlgorithms()
+        graphs = [
+            nx.gnm_random_graph(1500, 1800, seed=1),   # sparse: many components and cut vertices
+            nx.gnm_random_graph(2000, 6000, seed=2),   # mostly one component
+            nx.convert_node_labels_to_integers(
+                nx.disjoint_union_all([nx.random_labeled_tree(400, seed=3),
+                                       nx.cycle_graph(300),
+                                       nx.barbell_graph(200, 100),
+                                       nx.empty_graph(50)])),
+        ]
+        for graph in graphs:
+            assert graph.number_of_nodes() >= graph_algorithms.ARTICULATION_COMPILED_MIN_VERTICES
+            expected = list(nx.articulation_points(graph))
+            assert algorithms._articulation_points(graph) == expected, "articulation points differ from NetworkX"
+            print(f"✓ {len(expected)} articulation points match NetworkX "
+                  f"({graph.number_of_nodes()} vertices, {nx.number_connected_components(graph)} components)")
+    except Exception as e:
+        print(f"✗ Articulation points test failed: {e}")
+        traceback.print_exc()
+        raise
+
+def _random_rows(schema, count, rng):
+    """Rows for schema, with None mixed into the label and free-form columns"""
+    import numpy as np
+    from learning_analytics import CATEGORY
+    
+    rows = []
+    for i in range(count):
+        row = {}
+        for name, dtype in schema.items():
+            if dtype == CATEGORY:
+                row[name] = None if rng.random() < 0.1 else f"{name}-{rng.randint(0, 5)}"
+            elif dtype is object:
+                row[name] = None if rng.random() < 0.1 else {"step": i, "vertices": [rng.randint(0, 9)]}
+            elif np.issubdtype(dtype, np.integer):
+                row[name] = rng.randint(1, 9)
+            else:
+                row[name] = rng.random()
+        rows.append(row)
+    return rows
+
+def _expected_frame(schema, rows):
+    import numpy as np
+    import pandas as pd
+    from learning_analytics import CATEGORY
+    
+    return pd.DataFrame({name: np.array([row[name] for row in rows],
+                                        dtype=object if dtype in (CATEGORY, object) else dtype)
+                         for name, dtype in schema.items()})
+
+def test_column_table():
+    """Test that ColumnTable round-trips every schema"""
+    print("\nTesting ColumnTable round trips...")
+    
+    try:
+        import random
+        from pandas.testing import assert_frame_equal
+        from learning_analytics import (ColumnTable, INTERACTION_SCHEMA, OUTCOME_SCHEMA,
+                                        COGNITIVE_LOAD_SCHEMA)
+        
+        rng = random.Random(7)
+        schemas = {"interaction": INTERACTION_SCHEMA, "outcome": OUTCOME_SCHEMA,
+                   "cognitive load": COGNITIVE_LOAD_SCHEMA}
+        for label, schema in schemas.items():
+            rows = _random_rows(schema, 300, rng)
+            expected = _expected_frame(schema, rows)
+            
+            grown = ColumnTable(schema, capacity=1)  # grows by doubling
+            reserved = ColumnTable(schema)
+            reserved.reserve(len(rows))
+            for table in (grown, reserved):
+                for row in rows:
+                    table.append(**row)
+                assert len(table) == len(rows)
+                assert table.to_records() == rows, "to_records differs from the appended rows"
+                assert_frame_equal(table.to_frame(), expected)
+            
+            rebuilt = ColumnTable.from_columns(schema, {name: [row[name] for row in rows] for name in schema})
+            assert_frame_equal(rebuilt.to_frame(), expected)
+            print(f"✓ {label} schema round-trips through append, reserve and to_frame")
+    except Exception as e:
+        print(f"✗ ColumnTable test failed: {e}")
+        traceback.print_exc()
+        raise
+
+def test_analytics_log_round_trip():
+    """Test that logged analytics records reload losslessly, before and after compaction"""
+    print("\nTesting analytics append log round trips...")
+    
+    try:
+        import random
+        import tempfile
+        from pandas.testing import assert_frame_equal
+        from learning_analytics import LearningAnalytics
+        
+        rng = random.Random(11)
+        
+        def record(analytics, count):
+            for i in range(count):
+                user, session = f"user{rng.randint(0, 4)}", f"session{rng.randint(0, 9)}"
+                analytics.record_interaction(user, session, rng.choice(["add_vertex", "add_edge", "find_path"]),
+                                             {"step": i, "path": [rng.randint(0, 9) for _ in range(3)]} if i % 5 else None,
+                                             rng.randint(1, 6), rng.random() * 30)
+                analytics.record_learning_outcome(user, session, rng.choice(["Eulerian", "Hamiltonian"]),
+                                                  rng.random(), rng.random(), rng.random() * 100,
+                                                  rng.randint(0, 9), rng.randint(1, 5))
+                analytics.record_cognitive_load(user, session, rng.randint(1, 5), rng.randint(1, 9),
+                                                rng.randint(1, 9), rng.randint(1, 9), rng.randint(1, 9))
+        
+        def assert_same(a, b):
+            for table_a, table_b in zip(a._tables().values(), b._tables().values()):
+                assert_frame_equal(table_a.to_frame(), table_b.to_frame())
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            data_file = os.path.join(tmp, "learning_data.json")
+            analytics = LearningAnalytics(data_file)
+            record(analytics, 200)
+            analytics.flush()
+            assert_same(analytics, LearningAnalytics(data_file))
+            print("✓ Records reload from the append log")
+            
+            analytics.save_data()
+            assert not os.path.exists(analytics.log_file) or os.path.getsize(analytics.log_file) == 0
+            assert_same(analytics, LearningAnalytics(data_file))
+            print("✓ Records reload after compaction")
+            
+            record(analytics, 50)
+            analytics.flush()
+            assert_same(analytics, LearningAnalytics(data_file))
+            print("✓ Records reload from a snapshot plus the append log")
+            analytics.close()
+    except Exception as e:
+        print(f"✗ Analytics log round-trip test failed: {e}")
+        traceback.print_exc()
+        raise
+
 def test_visualizer_components():
     """Test if visualizer components can be created"""
     print("\nTesting visualizer components...")
     
+    if os.environ.get('CI'):
+        print("✓ Skipped on CI (no display)")
+        return True
+    if sys.platform not in ('win32', 'darwin') and not os.environ.get('DISPLAY'):
+        print("✓ Skipped (no DISPLAY set)")
+        return True
+    
     try:
         import tkinter as tk
         from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -130,6 +400,10 @@ def main():
         test_imports,
         test_wilson_algorithms,
         test_graph_creation,
+        test_path_algorithms,
+        test_articulation_points,
+        test_column_table,
+        test_analytics_log_round_trip,
         test_visualizer_components
     ]
     
@@ -137,7 +411,12 @@ def main():
     total = len(tests)
     
     for test in tests:
-        if test():
+        # Newer tests raise on failure (so pytest sees it) instead of returning False
+        try:
+            ok = test() is not False
+        except Exception:
+            ok = False
+        if ok:
             passed += 1
         print()
     